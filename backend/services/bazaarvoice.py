@@ -0,0 +1,99 @@
+"""Bazaarvoice review/Q&A API: endpoint discovery and response parsing.
+
+Lenovo and HP render their review and Q&A widgets from Bazaarvoice's JSON
+API. The browser scraper records which API URLs a review page requested;
+later runs fetch those URLs over plain HTTP and parse the JSON directly.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+import json_codec
+
+# API path suffix per kind of content the review widgets load
+ENDPOINT_SUFFIXES = (("reviews", "/reviews.json"), ("questions", "/questions.json"))
+
+
+def endpoint_kind(url: str) -> Optional[str]:
+    """'reviews' or 'questions' for a Bazaarvoice API URL, None for anything else."""
+    parts = urlparse(url)
+    if not (parts.netloc == "bazaarvoice.com" or parts.netloc.endswith(".bazaarvoice.com")):
+        return None
+    return next((kind for kind, suffix in ENDPOINT_SUFFIXES if parts.path.endswith(suffix)), None)
+
+
+class EndpointStore:
+    """Bazaarvoice API URLs per review page URL, persisted as JSON between runs."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        try:
+            self._endpoints: Dict[str, Dict[str, str]] = json_codec.loads(path.read_bytes())
+        except (OSError, ValueError):
+            self._endpoints = {}
+
+    def get(self, page_url: str) -> Optional[Dict[str, str]]:
+        return self._endpoints.get(page_url)
+
+    def record(self, page_url: str, endpoints: Dict[str, str]) -> None:
+        self._endpoints[page_url] = dict(endpoints)
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_bytes(json_codec.dumps(self._endpoints))
+
+
+def _clean(value: Any) -> Optional[str]:
+    return value.strip() if isinstance(value, str) and value.strip() else None
+
+
+def reviews_from_response(data: Dict[str, Any], source_url: str, fetched_at: str) -> List[Dict[str, Any]]:
+    """Review records, in the browser scraper's shape, from a reviews.json payload."""
+    reviews = []
+    for r in data.get("Results") or []:
+        rating = r.get("Rating")
+        reviews.append({
+            "source_url": source_url,
+            "rating": float(rating) if isinstance(rating, (int, float)) else None,
+            "title": _clean(r.get("Title")),
+            "body": _clean(r.get("ReviewText")),
+            "author": _clean(r.get("UserNickname")),
+            "date": _clean(r.get("SubmissionTime")),
+            "fetched_at": fetched_at,
+        })
+    return reviews
+
+
+def aggregate_from_response(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Average rating and review count, when the payload includes product statistics."""
+    found: Dict[str, Any] = {}
+    products = (data.get("Includes") or {}).get("Products") or {}
+    for product in products.values():
+        stats = product.get("ReviewStatistics") or {}
+        if stats.get("AverageOverallRating") is not None:
+            found["aggregate_rating"] = round(float(stats["AverageOverallRating"]), 1)
+        if stats.get("TotalReviewCount") is not None:
+            found["aggregate_review_count"] = int(stats["TotalReviewCount"])
+        break
+    if "aggregate_review_count" not in found and isinstance(data.get("TotalResults"), int):
+        found["aggregate_review_count"] = data["TotalResults"]
+    return found
+
+
+def qna_from_response(data: Dict[str, Any], source_url: str, fetched_at: str) -> List[Dict[str, Any]]:
+    """Q&A records from a questions.json payload, pairing each question with its first included answer."""
+    answers = (data.get("Includes") or {}).get("Answers") or {}
+    qna = []
+    for q in data.get("Results") or []:
+        question = _clean(q.get("QuestionSummary")) or _clean(q.get("QuestionDetails"))
+        answer_ids = q.get("AnswerIds") or []
+        answer = _clean((answers.get(str(answer_ids[0])) or {}).get("AnswerText")) if answer_ids else None
+        if question or answer:
+            qna.append({
+                "source_url": source_url,
+                "question": question,
+                "answer": answer,
+                "fetched_at": fetched_at,
+            })
+    return qna
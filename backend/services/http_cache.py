@@ -0,0 +1,73 @@
+"""SQLite-backed conditional GET cache for store pages fetched without a browser."""
+
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import json_codec
+
+
+class ConditionalCache:
+    """Remembers ETag/Last-Modified validators and the parsed result per URL.
+
+    Entries younger than ``ttl`` seconds are revalidated with If-None-Match /
+    If-Modified-Since, so an unchanged page costs a bodiless 304. A 304 does
+    not extend the entry: once ``ttl`` has passed since the last full fetch the
+    page is requested unconditionally again.
+    """
+
+    def __init__(self, path: Path, ttl: float = 3600):
+        self.ttl = ttl
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path))
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS pages (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                body TEXT,
+                parsed_json BLOB,
+                fetched_at REAL NOT NULL
+            )"""
+        )
+        self._conn.commit()
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for url if it is still within the TTL."""
+        row = self._conn.execute(
+            "SELECT etag, last_modified, body, parsed_json, fetched_at FROM pages WHERE url = ?",
+            (url,),
+        ).fetchone()
+        if not row or time.time() - row[4] >= self.ttl:
+            return None
+        etag, last_modified, body, parsed_json, fetched_at = row
+        return {
+            "etag": etag,
+            "last_modified": last_modified,
+            "body": body,
+            "parsed": json_codec.loads(parsed_json) if parsed_json else None,
+            "fetched_at": fetched_at,
+        }
+
+    @staticmethod
+    def validators(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Conditional request headers for a cached entry."""
+        headers: Dict[str, str] = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, url: str, etag: Optional[str], last_modified: Optional[str], body: str, parsed: Any) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO pages (url, etag, last_modified, body, parsed_json, fetched_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (url, etag, last_modified, body, json_codec.dumps(parsed), time.time()),
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
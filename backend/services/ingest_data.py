@@ -2,6 +2,7 @@
 
 import json
 import asyncio
+import logging
 from pathlib import Path
 from datetime import datetime
 from sqlalchemy.orm import Session
@@ -197,8 +198,8 @@ class DataIngestion:
                 return False
         return True
 
-    def load_json_file(self, filename: str) -> dict:
-        """Load data from a JSON file with robust path resolution."""
+    def _data_file_candidates(self, filename: str) -> list:
+        """Paths to try for a data file, most specific first."""
         # Candidates to try
         candidates = []
         p = Path(filename)
@@ -219,7 +220,11 @@ class DataIngestion:
                     candidates.append(self._live_dir / p.name)
             except Exception:
                 pass
-        for cand in candidates:
+        return candidates
+
+    def load_json_file(self, filename: str) -> dict:
+        """Load data from a JSON file with robust path resolution."""
+        for cand in self._data_file_candidates(filename):
             try:
                 if cand.exists():
                     with open(cand, 'r', encoding='utf-8') as f:
@@ -233,6 +238,29 @@ class DataIngestion:
         print(f"[ERROR] File not found via any candidate for: {filename}")
         return {}
 
+    def load_keyed_records(self, filename: str, fallback: str) -> dict:
+        """Group a JSONL file of {"key": ..., ...} lines into a dict of lists.
+
+        Falls back to the dict-of-lists JSON file when no JSONL has been
+        written yet (e.g. only dummy data is present).
+        """
+        path = next((c for c in self._data_file_candidates(filename) if c.exists()), None)
+        if path is None:
+            return self.load_json_file(fallback)
+        print(f"[INFO] Loading JSONL: {path}")
+        grouped: dict = {}
+        with open(path, 'r', encoding='utf-8') as f:
+            for lineno, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as je:
+                    print(f"[ERROR] Malformed JSONL in {path} line {lineno}: {je}")
+                    raise
+                grouped.setdefault(record.pop("key"), []).append(record)
+        return grouped
+
     def _post_ingestion_sanity(self):
         try:
             laptop_count = self.db.query(Laptop).count()
@@ -321,8 +349,8 @@ class DataIngestion:
             # Ingest data from files
             print("\n=== Step 3: Ingesting data ===")
             offers_data = self.load_json_file("../data/live/live_offers.json")
-            reviews_data = self.load_json_file("../data/live/live_reviews.json")
-            qna_data = self.load_json_file("../data/live/live_qna.json")
+            reviews_data = self.load_keyed_records("../data/live/live_reviews.jsonl", "../data/live/live_reviews.json")
+            qna_data = self.load_keyed_records("../data/live/live_qna.jsonl", "../data/live/live_qna.json")
 
             # Validate before ingesting
             if offers_data and not self._validate_offers_schema(offers_data):
@@ -348,8 +376,8 @@ class DataIngestion:
             self.db.rollback()
             
             offers_data = self.load_json_file("../data/live/live_offers.json")
-            reviews_data = self.load_json_file("../data/live/live_reviews.json")
-            qna_data = self.load_json_file("../data/live/live_qna.json")
+            reviews_data = self.load_keyed_records("../data/live/live_reviews.jsonl", "../data/live/live_reviews.json")
+            qna_data = self.load_keyed_records("../data/live/live_qna.jsonl", "../data/live/live_qna.json")
             
             if offers_data or reviews_data or qna_data:
                 print("\n=== Step 3: Ingesting existing scraped data ===")
@@ -414,4 +442,5 @@ async def main():
     await ingestion.run_full_ingestion(clear_existing=True)
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
     asyncio.run(main())
@@ -0,0 +1,24 @@
+"""JSON encode/decode helpers: orjson when installed, the stdlib json module otherwise."""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is pinned in requirements.txt, but it is only a speedup
+    orjson = None
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False, newline: bool = False) -> bytes:
+    """Serialize to UTF-8 bytes, compact unless indent is set."""
+    if orjson is not None:
+        option = (orjson.OPT_INDENT_2 if indent else 0) | (orjson.OPT_APPEND_NEWLINE if newline else 0)
+        return orjson.dumps(obj, option=option)
+    text = json.dumps(obj, ensure_ascii=False, indent=2 if indent else None, separators=None if indent else (",", ":"))
+    return (text + "\n" if newline else text).encode("utf-8")
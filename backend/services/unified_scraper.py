@@ -1,22 +1,446 @@
-import asyncio, json, re, datetime
+import asyncio, copy, functools, logging, os, re, time
+from collections import defaultdict
+from html import unescape
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
 
-from playwright.async_api import async_playwright, Page
-from tenacity import retry, stop_after_attempt, wait_fixed
+import httpx
+from playwright.async_api import async_playwright, Page, Route
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from tenacity import retry, stop_after_attempt, wait_exponential_jitter
 
 import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent))
 from targets import TARGETS
+from http_cache import ConditionalCache
+import bazaarvoice
+import json_codec
+
+logger = logging.getLogger(__name__)
 
 OUT_OFFERS = Path("../data/live/live_offers.json")
-OUT_REVIEWS = Path("../data/live/live_reviews.json")
-OUT_QNA = Path("../data/live/live_qna.json")
+OUT_REVIEWS = Path("../data/live/live_reviews.jsonl")
+OUT_QNA = Path("../data/live/live_qna.jsonl")
+LIVE_CACHE = Path("../data/live/live_cache.sqlite")
+STORAGE_STATE_DIR = Path("../data/live/storage_state")
+BV_ENDPOINTS = Path("../data/live/bv_endpoints.json")
+# Live data is written compact; set SCRAPER_PRETTY_JSON=true for readable diffs
+PRETTY_JSON = os.getenv("SCRAPER_PRETTY_JSON", "").lower() in ("1", "true")
+
+STRIP_COMMA = str.maketrans("", "", ",")
+MAX_CONCURRENT_PAGES = 4
+# Seconds a browser scrape result is reused for the same URL by a warm Scraper
+RESULT_TTL = 300
+
+# Text-presence tables, matched against a single innerText snapshot of the page
+LENOVO_AVAILABILITY_PHRASES = (
+    ("Add to cart", "InStock"),
+    ("Buy now", "InStock"),
+    ("In Stock", "InStock"),
+    ("Available", "InStock"),
+    ("Out of stock", "OutOfStock"),
+    ("Sold out", "OutOfStock"),
+    ("Temporarily unavailable", "OutOfStock"),
+    ("Discontinued", "Discontinued"),
+    ("Coming Soon", "PreOrder"),
+)
+LENOVO_PROMOS = (
+    "Weekly Deals", "Sale", "Save $", "Coupon", "Student Discount", "Free shipping",
+)
+HP_AVAILABILITY_PHRASES = (
+    ("ADD TO CART", "IN_STOCK"),
+    ("Out of stock", "OUT_OF_STOCK"),
+    ("Customize & Buy", "CUSTOMIZABLE"),
+)
+HP_PROMOS = (
+    "FREE Storewide Shipping", "3% back in HP Rewards", "Weekly Deals", "Save $", "Instant rebate",
+)
+
+# Lowercased needles, built once for case-insensitive matching
+LENOVO_AVAILABILITY_NEEDLES = tuple((phrase.lower(), code) for phrase, code in LENOVO_AVAILABILITY_PHRASES)
+LENOVO_PROMO_NEEDLES = tuple((promo, promo.lower()) for promo in LENOVO_PROMOS)
+HP_AVAILABILITY_NEEDLES = tuple((phrase.lower(), code) for phrase, code in HP_AVAILABILITY_PHRASES)
+HP_PROMO_NEEDLES = tuple((promo, promo.lower()) for promo in HP_PROMOS)
+
+
+def phrase_pattern(phrases) -> "re.Pattern[str]":
+    """Case-insensitive alternation of literal phrases, longest first."""
+    return re.compile("|".join(re.escape(p) for p in sorted(phrases, key=len, reverse=True)), re.I)
+
+
+# One scan of the page text per table; table order still decides priority
+LENOVO_AVAILABILITY_RE = phrase_pattern(phrase for phrase, _ in LENOVO_AVAILABILITY_PHRASES)
+LENOVO_PROMO_RE = phrase_pattern(LENOVO_PROMOS)
+HP_AVAILABILITY_RE = phrase_pattern(phrase for phrase, _ in HP_AVAILABILITY_PHRASES)
+HP_PROMO_RE = phrase_pattern(HP_PROMOS)
+IN_STOCK_TERMS = ("in stock", "available", "add to cart")
+OUT_OF_STOCK_TERMS = ("out of stock", "unavailable", "sold out")
+SHIPPING_TERMS = ("ship", "deliver", "days", "weeks")
+
+# Shipping ETA snippets, searched in the page text instead of text= locators
+LENOVO_SHIPPING_RE = re.compile(
+    r"(?:Ships? in \d+[\s-]?\d*\s*(?:business\s*)?days?"
+    r"|Deliver(?:y|s) in \d+[\s-]?\d*\s*(?:business\s*)?days?"
+    r"|Free shipping|Ships? by)[^.\n]{0,80}",
+    re.I,
+)
+HP_SHIPPING_RE = re.compile(r"(?:Ships (?:in|by)|Delivery|Est\.?\s*ship)[^.\n]{0,80}", re.I)
+
+# Readiness markers awaited after navigation instead of fixed sleeps
+LENOVO_PDP_READY = "script[type='application/ld+json'], [data-test='pricingPrice']"
+HP_PDP_READY = "script[type='application/ld+json'], [data-automation-id='product-price']"
+# JSON-LD ships in the server HTML, so the markers above can match before the
+# client renders prices; these are awaited before the DOM fallbacks run
+LENOVO_PRICE_READY = "[data-test='pricingPrice']"
+HP_PRICE_READY = "[data-automation-id='product-price']"
+HP_REVIEWS_READY = ".review, .bv-content-item, [data-bv-review-id]"
+LENOVO_REVIEWS_TAB_READY = "button[data-tkey='ratingsReviews'], button[data-tkey='questionsAndAnswers']"
+LENOVO_REVIEWS_READY = "div[data-bv-v='contentItem'], section[id='bv-reviews_container']"
+# Rating summary widgets, so aggregates are read without serializing the whole page
+HP_RATING_SUMMARY_SELECTORS = ["[data-bv-show='rating_summary']", ".bv-rating-ratio", ".reviews-summary"]
+
+# Text of every JSON-LD block, collected in-page in one round-trip
+JSONLD_TEXTS_JS = (
+    "() => Array.from(document.querySelectorAll(\"script[type='application/ld+json']\"), s => s.textContent)"
+)
+
+# querySelector/querySelectorAll that also descend into open shadow roots, as
+# Playwright's CSS engine does (review widgets may render into one). Inlined
+# into the helpers below; deepQuery only walks shadow roots when the light DOM misses.
+DEEP_QUERY_JS = """
+  const shadowRoots = root => {
+    const hosts = Array.from(root.querySelectorAll("*")).filter(el => el.shadowRoot);
+    if (root.shadowRoot) hosts.unshift(root);
+    return hosts.map(el => el.shadowRoot);
+  };
+  const deepQuery = (root, sel) => {
+    const hit = root.querySelector(sel);
+    if (hit) return hit;
+    for (const shadow of shadowRoots(root)) {
+      const found = deepQuery(shadow, sel);
+      if (found) return found;
+    }
+    return null;
+  };
+  const deepQueryAll = (root, sel) => {
+    const found = Array.from(root.querySelectorAll(sel));
+    for (const shadow of shadowRoots(root)) found.push(...deepQueryAll(shadow, sel));
+    return found;
+  };
+"""
+
+# textContent of each selector's first match (null when missing or hidden),
+# so a whole selector cascade costs one round-trip
+VISIBLE_TEXTS_JS = """
+(selectors) => {""" + DEEP_QUERY_JS + """
+  const visible = el => !!el && el.getClientRects().length > 0 && getComputedStyle(el).visibility !== "hidden";
+  return selectors.map(sel => {
+    const el = deepQuery(document, sel);
+    return visible(el) ? el.textContent : null;
+  });
+}
+"""
+
+# textContent of a locator's first match when it is visible; evaluate_all
+# does not wait for a match, so a miss costs one round-trip as well
+FIRST_MATCH_TEXT_JS = """
+(els) => {
+  const el = els[0];
+  const visible = !!el && el.getClientRects().length > 0 && getComputedStyle(el).visibility !== "hidden";
+  return visible ? el.textContent : null;
+}
+"""
+
+# innerText of the first selector (in priority order) present on the page
+SCOPED_TEXT_JS = """
+(selectors) => {""" + DEEP_QUERY_JS + """
+  for (const sel of selectors) {
+    const el = deepQuery(document, sel);
+    if (el) return el.innerText;
+  }
+  return null;
+}
+"""
+
+# Per-card field candidates collected in-page in one round-trip. Cards come from
+# the first card selector (CSS, or "xpath=..." like Playwright) with any match. Each field maps to one entry per
+# selector: null when the selector has no visible match inside the card,
+# otherwise the element's text and the attributes the parsers use.
+CARD_FIELDS_JS = """
+({cards, limit, fields}) => {""" + DEEP_QUERY_JS + """
+  const visible = el => !!el && el.getClientRects().length > 0 && getComputedStyle(el).visibility !== "hidden";
+  const snap = el => visible(el) ? {
+    text: el.textContent,
+    aria: el.getAttribute("aria-label"),
+    rating: el.getAttribute("data-rating"),
+    datetime: el.getAttribute("datetime"),
+  } : null;
+  const queryAll = sel => {
+    if (!sel.startsWith("xpath=")) return deepQueryAll(document, sel);
+    const snap = document.evaluate(sel.slice(6), document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    return Array.from({length: snap.snapshotLength}, (_, i) => snap.snapshotItem(i));
+  };
+  for (const selector of cards) {
+    const found = queryAll(selector);
+    if (!found.length) continue;
+    const items = Array.from(found).slice(0, limit).map(card => {
+      const out = {};
+      for (const [name, selectors] of Object.entries(fields)) {
+        out[name] = selectors.map(sel => snap(deepQuery(card, sel)));
+      }
+      return out;
+    });
+    return {selector, count: found.length, items};
+  }
+  return null;
+}
+"""
+
+# Price extraction, tried in order of specificity
+MONEY_PATTERNS = tuple(re.compile(p, re.I) for p in (
+    r'\$\s*([0-9][0-9,]*\.?[0-9]{0,2})',  # $1,234.56
+    r'USD\s*\$?\s*([0-9][0-9,]*\.?[0-9]{0,2})',  # USD $1234.56 or USD 1234.56
+    r'Price:\s*\$?\s*([0-9][0-9,]*\.?[0-9]{0,2})',  # Price: $1234.56
+    r'Starting at\s*\$?\s*([0-9][0-9,]*\.?[0-9]{0,2})',  # Starting at $1234.56
+    r'([0-9][0-9,]*\.?[0-9]{0,2})\s*USD',  # 1234.56 USD
+    r'([0-9][0-9,]*\.?[0-9]{0,2})',  # Just numbers
+))
+
+PLAIN_PRICE_RE = re.compile(r"[0-9]+(?:\.[0-9]{0,2})?")
+USD_MARKER_RE = re.compile(r"\$|USD", re.I)
+
+# Review ratings: page-level aggregates and per-card values
+AGG_RATING_PATTERNS = tuple(re.compile(p, re.I) for p in (
+    r"([0-5]\.?[0-9]?)\s*out of\s*5",
+    r"([0-5]\.?[0-9]?)\s*/\s*5",
+    r"Rating:\s*([0-5]\.?[0-9]?)",
+    r"([0-5]\.?[0-9]?)\s*stars?",
+))
+AGG_COUNT_PATTERNS = tuple(re.compile(p, re.I) for p in (
+    r"(\d{1,4})\s+reviews?",
+    r"(\d{1,4})\s+customer reviews?",
+    r"Based on\s+(\d{1,4})\s+reviews?",
+    r"(\d{1,4})\s+ratings?",
+))
+RATING_ARIA_RE = re.compile(r"([0-5]\.?[0-9]?)\s*(?:out of 5|stars?)", re.I)
+RATING_TEXT_RE = re.compile(r"([0-5]\.?[0-9]?)\s*(?:out of 5|stars?|/5)", re.I)
+# data-rating attribute values; ASCII-only so float() accepts whatever matches
+RATING_VALUE_RE = re.compile(r"\d+\.?\d*|\.\d+", re.ASCII)
+
+# Raw-HTML parsing for the browserless fast path
+JSONLD_SCRIPT_RE = re.compile(r"<script[^>]+type=[\"']application/ld\+json[\"'][^>]*>(.*?)</script>", re.I | re.S)
+HTML_NOISE_RE = re.compile(r"<(script|style|noscript)\b.*?</\1\s*>", re.I | re.S)
+HTML_TAG_RE = re.compile(r"<[^>]+>")
+# Opening tags of shipping/price containers, standing in for the browser's
+# scoped selectors; only the markup right after one is searched, since the
+# whole page text also carries hidden nav, footer and template copy
+SHIPPING_MARKUP_RE = re.compile(
+    r"<\w+[^>]*?\s(?:class|data-testid|data-test|data-automation-id)=[\"'][^\"']*?(?:shipping|delivery)[^>]*>", re.I
+)
+PRICE_MARKUP_RE = re.compile(
+    r"<\w+[^>]*?\s(?:class|data-testid|data-test|data-automation-id)=[\"'][^\"']*?price[^>]*>", re.I
+)
+MARKUP_SNIPPET = 500
+PRICE_TEXT_RE = re.compile(r"(?:\$|USD)\s*\d[\d,]*\.?\d*", re.I)
+
+# schema.org CamelCase availability -> HP's UPPER_SNAKE codes
+CAMEL_BOUNDARY_RE = re.compile(r"(?<!^)(?=[A-Z])")
+
+# Selector cascades, tried in order
+LENOVO_PRICE_SELECTORS = (
+    "[data-test='pricingPrice']",
+    "[data-testid='pricingPrice']",
+    "[data-testid='price']",
+    ".pricing-price",
+    ".price-current",
+    ".price",
+    ".final-price",
+    "[class*='price']",
+    "[data-price]",
+)
+
+# Playwright text-regex locators tried when no price selector matched
+DOLLAR_PRICE_TEXT = r"text=/\$\s?\d[\d,]*\.?\d*/"
+LENOVO_PRICE_TEXT_PATTERNS = (
+    DOLLAR_PRICE_TEXT,
+    r"text=/USD\s*\$?\s*\d[\d,]*\.?\d*/",
+    r"text=/Price:\s*\$\d[\d,]*\.?\d*/",
+)
+LENOVO_AVAILABILITY_SELECTORS = (
+    "[data-testid='availability']",
+    ".availability",
+    "[class*='stock']",
+    "[class*='availability']",
+)
+LENOVO_SHIPPING_SELECTORS = (
+    "[data-testid='shipping']",
+    ".shipping-info",
+    ".delivery-info",
+    "[class*='shipping']",
+    "[class*='delivery']",
+)
+HP_PRICE_SELECTORS = (
+    "[data-automation-id='product-price']",
+    "[data-testid='price']",
+    "[data-automation='final-price']",
+    ".product-price",
+    ".price",
+)
+
+# Review card fields, in priority order (lists so they serialize to page.evaluate)
+HP_REVIEW_FIELDS = {
+    "rating": [
+        "[aria-label*='out of 5']",
+        "[aria-label*='stars']",
+        ".rating",
+        ".bv-off-screen",
+        ".star-rating",
+        "[data-rating]",
+        ".review-rating",
+    ],
+    "body": [
+        ".bv-content-review-text",
+        ".content",
+        ".review-body",
+        "[itemprop='reviewBody']",
+        ".review-text",
+        ".review-content",
+        ".customer-review-text",
+    ],
+    "title": [
+        ".review-title",
+        ".bv-content-title",
+        "[itemprop='name']",
+        ".review-headline",
+        ".review-summary",
+        "h3", "h4", "h5",
+    ],
+    "author": [
+        ".bv-author",
+        ".review-author",
+        "[itemprop='author']",
+        ".reviewer-name",
+        ".customer-name",
+    ],
+    "date": ["time, [itemprop='datePublished'], .review-date, .date"],
+}
+LENOVO_REVIEW_FIELDS = {
+    "rating": [
+        "div[class*='bv-rmr_sc-16dr711-19'][class*='dzPMOO']",  # Rating from your screenshot
+        "div[aria-label*='out of 5']",                          # Aria label rating
+        "div[class*='bv-rmr_sc-16dr711-1']",                    # Fallback
+    ],
+    "body": [
+        "div[class*='bv-rmr_sc-16dr711-13'][class*='fNeoZ']",  # Review text from your screenshot
+        "div[data-bv-v='contentSummary']",                     # Content summary from your HTML
+        "div[class*='bv-rmr_sc-16dr711-13']",                  # Fallback
+    ],
+    "title": [
+        "div[class*='bv-rmr_sc-16dr711-14'][class*='fKaKqJ']",  # Title from your screenshot
+        "div[data-bv-v='contentHeader']",                       # Header from your HTML
+        "div[class*='bv-rmr_sc-16dr711-14']",                   # Fallback
+    ],
+    "author": [
+        ".review-author",
+        ".reviewer-name",
+        ".customer-name",
+        "[itemprop='author']",
+    ],
+    "date": ["time, [itemprop='datePublished'], .review-date, .date"],
+}
+HP_QNA_FIELDS = {
+    "question": [
+        ".question-text",
+        ".bv-question-summary",
+        ".bv-content-summary-body",
+        "[itemprop='question']",
+        ".question-content",
+        ".q-text",
+    ],
+    "answer": [
+        ".answer",
+        ".bv-answer",
+        "[data-bv-answer-id]",
+        "[itemprop='acceptedAnswer']",
+        ".answer-text",
+        ".a-text",
+    ],
+}
+LENOVO_QNA_FIELDS = {
+    "question": HP_QNA_FIELDS["question"] + [".qa-question"],
+    "answer": HP_QNA_FIELDS["answer"] + [".qa-answer"],
+}
+
+# Card containers, tried in order by CARD_FIELDS_JS (lists, since they are
+# passed to evaluate)
+HP_REVIEW_CARDS = [
+    ".review",
+    ".bv-content-item",
+    "[data-bv-review-id]",
+    "article",
+    ".review-item",
+    ".customer-review",
+    ".product-review",
+    "[data-testid='review']",
+    ".bv-content-review",
+    ".review-card",
+]
+# CSS selectors first, then XPath fallbacks, resolved in the same evaluate
+LENOVO_REVIEW_CARDS = [
+    "div[data-bv-v='contentItem']",
+    "div[class*='bv-rmr_sc-16dr711']",
+    "[class*='jEfJcJ']",
+    "section[id='bv-reviews_container'] div",
+    "xpath=//div[contains(@class, 'bv-rmr_sc') and contains(@class, '16dr711')]",
+    "xpath=//section[contains(@id, 'bv-review')]",
+    "xpath=//div[contains(@data-bv-v, 'contentitem')]",
+]
+HP_QNA_CARDS = [
+    ".qa",
+    ".question",
+    ".bv-question",
+    "[data-bv-question-id]",
+    ".q-and-a",
+    ".faq-item",
+    ".question-answer",
+]
+LENOVO_QNA_CARDS = HP_QNA_CARDS + [".review-qa"]
+LENOVO_QNA_READY = ", ".join(LENOVO_QNA_CARDS)
+
+# Controls clicked on the way to the review content
+LENOVO_POPUP_SELECTORS = ("button:has-text('Accept')", "button:has-text('Close')", ".modal-close", "[aria-label='Close']")
+HP_LOAD_MORE_SELECTORS = (
+    "button:has-text('Show more')",
+    "button:has-text('Load more')",
+    "button:has-text('View all')",
+    ".load-more",
+    "[data-testid='load-more']",
+)
+LENOVO_REVIEWS_TAB = 'button[data-tkey="ratingsReviews"]'
+LENOVO_REVIEWS_TAB_FALLBACKS = (
+    'button[aria-label*="Ratings"]',
+    'button[aria-label*="Reviews"]',
+    "button:has-text('Reviews')",
+    "a:has-text('Reviews')",
+    "[data-tab='reviews']",
+    ".reviews-tab",
+    "#reviews-tab",
+)
+LENOVO_QNA_TAB = 'button[data-tkey="questionsAndAnswers"]'
+
+
+# (second, formatted) of the last now_iso() call; timestamps are second-granular
+_now_iso_cache: Tuple[int, str] = (-1, "")
 
 
 def now_iso() -> str:
-    return datetime.datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+    global _now_iso_cache
+    sec = int(time.time())
+    if sec != _now_iso_cache[0]:
+        _now_iso_cache = (sec, time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(sec)))
+    return _now_iso_cache[1]
 
 
 def money_to_float(txt: Optional[Any]) -> Optional[float]:
@@ -29,23 +453,21 @@ def money_to_float(txt: Optional[Any]) -> Optional[float]:
         except Exception:
             return None
     
-    s = str(txt).strip()
-    
-    # Improved price extraction patterns
-    patterns = [
-        r'\$\s*([0-9][0-9,]*\.?[0-9]{0,2})',  # $1,234.56
-        r'USD\s*\$?\s*([0-9][0-9,]*\.?[0-9]{0,2})',  # USD $1234.56 or USD 1234.56
-        r'Price:\s*\$?\s*([0-9][0-9,]*\.?[0-9]{0,2})',  # Price: $1234.56
-        r'Starting at\s*\$?\s*([0-9][0-9,]*\.?[0-9]{0,2})',  # Starting at $1234.56
-        r'([0-9][0-9,]*\.?[0-9]{0,2})\s*USD',  # 1234.56 USD
-        r'([0-9][0-9,]*\.?[0-9]{0,2})',  # Just numbers
-    ]
-    
-    for pattern in patterns:
-        m = re.search(pattern, s.replace(",", ""), re.IGNORECASE)
+    return _money_to_float_cached(str(txt).strip())
+
+
+@functools.lru_cache(maxsize=2048)
+def _money_to_float_cached(s: str) -> Optional[float]:
+    # Bare JSON-LD price strings ("1299.00") can only match the last pattern,
+    # and would match it whole, so skip the prefixed patterns for them
+    if PLAIN_PRICE_RE.fullmatch(s):
+        price = float(s)
+        return price if 10 <= price <= 50000 else None
+    for pattern in MONEY_PATTERNS:
+        m = pattern.search(s)
         if m:
             try:
-                price = float(m.group(1).replace(",", ""))
+                price = float(m.group(1).translate(STRIP_COMMA))
                 # Sanity check - prices should be reasonable
                 if 10 <= price <= 50000:  # Between $10 and $50,000
                     return price
@@ -56,225 +478,511 @@ def money_to_float(txt: Optional[Any]) -> Optional[float]:
 
 
 def pick_currency(txt: Optional[Any]) -> Optional[str]:
-    if txt is None:
+    if txt is None or isinstance(txt, (int, float)):
         return None
-    s = str(txt)
-    if "$" in s or "USD" in s.upper():
-        return "USD"
-    return None
+    return _pick_currency_cached(str(txt))
 
 
-async def read_jsonld_from_dom(page: Page) -> List[Dict[str, Any]]:
-    blocks = page.locator("script[type='application/ld+json']")
-    n = await blocks.count()
-    out = []
-    for i in range(n):
-        raw = await blocks.nth(i).text_content()
+@functools.lru_cache(maxsize=2048)
+def _pick_currency_cached(s: str) -> Optional[str]:
+    return "USD" if USD_MARKER_RE.search(s) else None
+
+
+def iter_jsonld_nodes(data: Any) -> Iterator[Dict[str, Any]]:
+    """Yield the object nodes of one decoded JSON-LD block, expanding lists and @graph."""
+    if isinstance(data, list):
+        for item in data:
+            yield from iter_jsonld_nodes(item)
+    elif isinstance(data, dict):
+        yield data
+        if isinstance(data.get("@graph"), list):
+            yield from iter_jsonld_nodes(data["@graph"])
+
+
+async def stream_jsonld_from_dom(page: Page) -> AsyncIterator[Dict[str, Any]]:
+    """Decode JSON-LD script blocks lazily so callers can stop at the node they need.
+
+    All block texts come back from a single evaluate() call; only the decoding
+    is incremental.
+    """
+    raws = await page.evaluate(JSONLD_TEXTS_JS)
+    for raw in raws or []:
         if not raw:
             continue
         try:
-            data = json.loads(raw)
-            if isinstance(data, list):
-                out.extend(data)
-            else:
-                out.append(data)
+            data = json_codec.loads(raw)
         except Exception:
-            pass
-    return out
+            continue
+        for node in iter_jsonld_nodes(data):
+            yield node
+
+
+async def read_jsonld_from_dom(page: Page) -> List[Dict[str, Any]]:
+    return [node async for node in stream_jsonld_from_dom(page)]
+
+
+async def read_product_from_dom(page: Page) -> Dict[str, Any]:
+    """Return the first Product node without decoding the blocks after it."""
+    async for node in stream_jsonld_from_dom(page):
+        if is_product_node(node):
+            return node
+    return {}
+
+
+def is_product_node(node: Dict[str, Any]) -> bool:
+    t = node.get("@type")
+    if isinstance(t, str):
+        return t.lower() == "product"
+    if isinstance(t, list):
+        return any(isinstance(x, str) and x.lower() == "product" for x in t)
+    return False
+
+
+def offer_fields_from_product(prod: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Return the (offers, aggregateRating) dicts of a JSON-LD Product node."""
+    if not prod:
+        return {}, {}
+    offers = prod.get("offers") or {}
+    if isinstance(offers, list):
+        offers = offers[0] if offers and isinstance(offers[0], dict) else {}
+    agg = prod.get("aggregateRating") or {}
+    return offers, agg
+
+
+def aggregate_rating_fields(agg: Dict[str, Any]) -> Tuple[Any, Any]:
+    """(rating, review count) from a JSON-LD aggregateRating dict."""
+    if not agg:
+        return None, None
+    return agg.get("ratingValue"), agg.get("reviewCount") or agg.get("ratingCount")
+
+
+async def read_scoped_text(page: Page, selectors: List[str]) -> Optional[str]:
+    """innerText of the first matching selector, or None if none is present."""
+    try:
+        return await page.evaluate(SCOPED_TEXT_JS, selectors)
+    except Exception:
+        return None
+
+
+async def read_dom_text(page: Page) -> str:
+    """Page text from the serialized DOM, which unlike innerText forces no layout."""
+    try:
+        return html_to_text(await page.content())
+    except Exception:
+        return ""
+
+
+def review_aggregate_from_text(text: str) -> Dict[str, Any]:
+    """Aggregate rating/review count found in a block of page text."""
+    found: Dict[str, Any] = {}
+    for pattern in AGG_RATING_PATTERNS:
+        m = pattern.search(text)
+        if m:
+            found["aggregate_rating"] = float(m.group(1))
+            break
+    for pattern in AGG_COUNT_PATTERNS:
+        m2 = pattern.search(text)
+        if m2:
+            found["aggregate_review_count"] = int(m2.group(1))
+            break
+    return found
+
+
+async def visible_texts(page: Page, selectors: Tuple[str, ...]) -> List[Optional[str]]:
+    """Text of each selector's first visible match, in selector order."""
+    try:
+        return await page.evaluate(VISIBLE_TEXTS_JS, list(selectors))
+    except Exception as e:
+        logger.debug("Selector probe failed: %s", e)
+        return [None] * len(selectors)
+
+
+async def locator_text(page: Page, selector: str) -> Optional[str]:
+    """Text of the selector's first match if it is visible, else None."""
+    try:
+        return await page.locator(selector).evaluate_all(FIRST_MATCH_TEXT_JS)
+    except Exception:
+        return None
+
+
+async def first_visible_text(page: Page, selectors: Tuple[str, ...]) -> Optional[str]:
+    """Probe the selectors concurrently and return the first text found.
+
+    The probes overlap, but results are taken in selector order so the
+    preferred pattern wins regardless of which probe answers first.
+    """
+    texts = await asyncio.gather(*(locator_text(page, sel) for sel in selectors))
+    return next((text for text in texts if text), None)
+
+
+async def read_card_fields(page: Page, cards: List[str], fields: Dict[str, List[str]], limit: int) -> List[Dict[str, Any]]:
+    """Snapshot the candidate elements of up to limit cards with a single evaluate."""
+    try:
+        found = await page.evaluate(CARD_FIELDS_JS, {"cards": cards, "limit": limit, "fields": fields})
+    except Exception as e:
+        logger.debug("Card extraction failed: %s", e)
+        return []
+    if not found:
+        return []
+    logger.debug("Found %s elements with selector: %s", found["count"], found["selector"])
+    return found["items"]
+
+
+def rating_from_candidates(candidates: List[Optional[Dict[str, Any]]]) -> Optional[float]:
+    """First rating found via aria-label, data-rating or text, per selector in order."""
+    for el in candidates:
+        if not el:
+            continue
+        if el["aria"]:
+            mm = RATING_ARIA_RE.search(el["aria"])
+            if mm:
+                return float(mm.group(1))
+        data_rating = el["rating"]
+        if data_rating and RATING_VALUE_RE.fullmatch(data_rating):
+            return float(data_rating)
+        if el["text"]:
+            mm2 = RATING_TEXT_RE.search(el["text"])
+            if mm2:
+                return float(mm2.group(1))
+    return None
+
+
+def text_from_candidates(candidates: List[Optional[Dict[str, Any]]], min_len: int) -> Optional[str]:
+    """First visible text longer than min_len, else the last visible text seen."""
+    text = None
+    for el in candidates:
+        if not el:
+            continue
+        text = el["text"]
+        if text and len(text.strip()) > min_len:
+            break
+    return text
+
+
+async def wait_for_ready(page: Page, selector: str, timeout: float = 3000) -> bool:
+    """Wait until any element matching selector is attached; False on timeout."""
+    try:
+        await page.wait_for_selector(selector, state="attached", timeout=timeout)
+        return True
+    except PlaywrightTimeoutError:
+        return False
+
+
+async def goto_document(page: Page, url: str) -> None:
+    """Navigate to url, only switching the fragment if the page already shows that document.
+
+    Lenovo review URLs are the PDP plus "#reviews"; when the PDP was just
+    scraped on this page there is no need to load it again. A page already on
+    the exact URL is reloaded, since setting the same hash would be a no-op.
+    """
+    target = urlparse(url)
+    current = urlparse(page.url)
+    if (
+        target.fragment
+        and current.fragment != target.fragment
+        and current._replace(fragment="") == target._replace(fragment="")
+    ):
+        await page.evaluate("hash => { location.hash = hash }", target.fragment)
+    else:
+        await page.goto(url, wait_until="domcontentloaded")
+
+
+async def wait_for_network_idle(page: Page, timeout: float = 2000) -> None:
+    """Let requests triggered by a click settle, giving up after timeout ms."""
+    try:
+        await page.wait_for_load_state("networkidle", timeout=timeout)
+    except PlaywrightTimeoutError:
+        pass
+
+
+async def read_body_text(page: Page) -> str:
+    """Fetch the rendered page text in one round-trip for substring checks."""
+    try:
+        return await page.evaluate("() => document.body ? document.body.innerText : ''") or ""
+    except Exception:
+        return ""
 
 
 def extract_product_from_jsonld(ld_list: List[Dict[str, Any]]) -> Dict[str, Any]:
     prod = {}
     for node in ld_list:
-        t = node.get("@type") or node.get("@type".lower())
-        if not t:
-            continue
-        if (isinstance(t, str) and t.lower() == "product") or (isinstance(t, list) and "Product" in t):
+        if is_product_node(node):
             prod = node
             break
     return prod
 
 
-async def scrape_lenovo_pdp(page: Page, url: str) -> Dict[str, Any]:
-    await page.goto(url, wait_until="domcontentloaded")
-    await page.wait_for_timeout(2000)
-    
-    # Try to dismiss any popups/cookies
+def product_from_html(html: str) -> Dict[str, Any]:
+    """Return the first JSON-LD Product node embedded in raw page HTML."""
+    for raw in JSONLD_SCRIPT_RE.findall(html):
+        try:
+            data = json_codec.loads(raw)
+        except Exception:
+            continue
+        for node in iter_jsonld_nodes(data):
+            if is_product_node(node):
+                return node
+    return {}
+
+
+def html_to_text(html: str) -> str:
+    """Approximate the visible text of raw HTML for phrase matching."""
+    text = HTML_TAG_RE.sub(" ", HTML_NOISE_RE.sub(" ", html))
+    return " ".join(unescape(text).split())
+
+
+def scoped_html_match(html: str, markup: "re.Pattern[str]", pattern: "re.Pattern[str]") -> Optional[str]:
+    """First match of pattern in the text just after a container tag matched by markup."""
+    for tag in markup.finditer(html):
+        found = pattern.search(html_to_text(html[tag.end():tag.end() + MARKUP_SNIPPET]))
+        if found:
+            return found.group(0).strip()
+    return None
+
+
+def availability_from_text(text: str, pattern: "re.Pattern[str]", needles) -> Optional[str]:
+    """Code of the highest-priority availability phrase present in text."""
+    found = {m.lower() for m in pattern.findall(text)}
+    return next((code for needle, code in needles if needle in found), None)
+
+
+@functools.lru_cache(maxsize=256)
+def classify_availability(text: str) -> Optional[str]:
+    """InStock/OutOfStock for a short availability label, None if unrecognised."""
+    t = text.lower()
+    if any(term in t for term in IN_STOCK_TERMS):
+        return "InStock"
+    if any(term in t for term in OUT_OF_STOCK_TERMS):
+        return "OutOfStock"
+    return None
+
+
+def promos_from_text(text: str, pattern: "re.Pattern[str]", needles) -> List[str]:
+    """Promo badges present in text, in table order."""
+    found = {m.lower() for m in pattern.findall(text)}
+    return [promo for promo, needle in needles if needle in found]
+
+
+def hp_availability_code(code: str) -> str:
+    # schema.org InStock -> IN_STOCK, matching the HP phrase codes
+    return CAMEL_BOUNDARY_RE.sub("_", code).upper()
+
+
+def offer_from_product(
+    prod: Dict[str, Any], url: str, profile: Dict[str, Any], html: str, fetched_at: str
+) -> Optional[Dict[str, Any]]:
+    """Build an offer from JSON-LD alone, or None if price, availability or rating is missing.
+
+    A Product node without aggregateRating usually means the reviews widget
+    injects it client-side, so the rendered page is worth loading instead.
+    """
+    offers, agg = offer_fields_from_product(prod)
+    price = money_to_float(offers.get("price"))
+    agg_rating, agg_count = aggregate_rating_fields(agg)
+    if not price or not offers.get("availability") or agg_rating is None:
+        return None
+    currency = offers.get("priceCurrency") or pick_currency(offers.get("price"))
+    if not currency:
+        # Same fallback as the browser path, which reads the rendered price text
+        currency = pick_currency(scoped_html_match(html, PRICE_MARKUP_RE, PRICE_TEXT_RE))
+    return {
+        "source_url": url,
+        "price": price,
+        "currency": currency,
+        "availability": profile["availability"](str(offers.get("availability")).split("/")[-1]),
+        "shipping_eta": scoped_html_match(html, SHIPPING_MARKUP_RE, profile["shipping_re"]),
+        "promo_badges": promos_from_text(html_to_text(html), profile["promo_re"], profile["promo_needles"]),
+        "seller": profile["seller"],
+        "aggregate_rating": agg_rating,
+        "aggregate_review_count": agg_count,
+        "fetched_at": fetched_at,
+    }
+
+
+async def scrape_pdp_fast(
+    client: httpx.AsyncClient, cache: ConditionalCache, url: str, profile: Dict[str, Any], fetched_at: str
+) -> Optional[Dict[str, Any]]:
+    """Try to build the offer from a plain conditional GET, without Chromium.
+
+    Returns None when the request fails or the embedded JSON-LD lacks price,
+    availability or aggregateRating, in which case the caller falls back to
+    the browser scraper.
+    """
+    entry = cache.get(url)
     try:
-        popup_selectors = ["button:has-text('Accept')", "button:has-text('Close')", ".modal-close", "[aria-label='Close']"]
-        for sel in popup_selectors:
-            popup = page.locator(sel).first
-            if await popup.is_visible():
-                await popup.click()
-                await page.wait_for_timeout(1000)
-                break
-    except Exception:
-        pass
+        resp = await client.get(url, headers=cache.validators(entry))
+    except httpx.HTTPError as e:
+        logger.debug("Fast fetch failed for %s: %s", url, e)
+        return None
+    if resp.status_code == 304 and entry:
+        logger.debug("Not modified, reusing cached parse for %s", url)
+        html, prod = entry["body"], entry["parsed"] or {}
+    elif resp.status_code == 200:
+        html = resp.text
+        prod = product_from_html(html)
+        cache.store(url, resp.headers.get("etag"), resp.headers.get("last-modified"), html, prod)
+    else:
+        logger.debug("Fast fetch got HTTP %s for %s", resp.status_code, url)
+        return None
+    return offer_from_product(prod, url, profile, html, fetched_at)
+
+
+async def scrape_pdps_fast(
+    client: httpx.AsyncClient,
+    cache: ConditionalCache,
+    targets: Dict[str, Dict[str, Any]],
+    run_ts: str,
+    offers: Dict[str, List[Dict[str, Any]]],
+) -> None:
+    """Fetch every PDP over plain HTTP concurrently, recording the offers JSON-LD alone can answer."""
+    jobs = []
+    for key, target in targets.items():
+        profile = HOST_SCRAPERS.get(urlparse(target["pdp"]).netloc)
+        if profile:
+            jobs.append((key, scrape_pdp_fast(client, cache, target["pdp"], profile, run_ts)))
+    results = await asyncio.gather(*(job for _, job in jobs), return_exceptions=True)
+    for (key, _), result in zip(jobs, results):
+        if isinstance(result, Exception):
+            logger.debug("Fast path failed for %s: %s", key, result)
+        elif result is not None:
+            offers[key].append(result)
+    logger.info("Fast path resolved %s of %s PDPs", sum(bool(offers[k]) for k, _ in jobs), len(jobs))
+
+
+ReviewsPage = Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Dict[str, Any]]
+
+
+async def scrape_reviews_fast(
+    client: httpx.AsyncClient, endpoints: bazaarvoice.EndpointStore, url: str
+) -> Optional[ReviewsPage]:
+    """Read a review page's reviews and Q&A straight from its Bazaarvoice API URLs.
+
+    Returns None when no endpoint was recorded for the page yet or any request
+    fails, in which case the caller falls back to the browser scraper.
+    """
+    urls = endpoints.get(url)
+    if not urls or "reviews" not in urls:
+        return None
+    ts = now_iso()
+    try:
+        responses = await asyncio.gather(*(client.get(u) for u in urls.values()))
+    except httpx.HTTPError as e:
+        logger.debug("Bazaarvoice fetch failed for %s: %s", url, e)
+        return None
+    data = {}
+    for kind, resp in zip(urls, responses):
+        if resp.status_code != 200:
+            logger.debug("Bazaarvoice %s got HTTP %s for %s", kind, resp.status_code, url)
+            return None
+        data[kind] = json_codec.loads(resp.content)
+        if data[kind].get("HasErrors"):
+            logger.debug("Bazaarvoice %s returned errors for %s: %s", kind, url, data[kind].get("Errors"))
+            return None
+    reviews = bazaarvoice.reviews_from_response(data["reviews"], url, ts)
+    qna = bazaarvoice.qna_from_response(data["questions"], url, ts) if "questions" in data else []
+    aggregate = {"source_url": url, "fetched_at": ts, **bazaarvoice.aggregate_from_response(data["reviews"])}
+    return reviews, qna, aggregate
+
+
+async def scrape_reviews_pages_fast(
+    client: httpx.AsyncClient, endpoints: bazaarvoice.EndpointStore, targets: Dict[str, Dict[str, Any]]
+) -> Dict[str, ReviewsPage]:
+    """Fetch every review page with a known Bazaarvoice endpoint concurrently, keyed by page URL."""
+    urls = list(dict.fromkeys(rurl for target in targets.values() for rurl in target["reviews"]))
+    results = await asyncio.gather(*(scrape_reviews_fast(client, endpoints, u) for u in urls), return_exceptions=True)
+    resolved = {}
+    for rurl, result in zip(urls, results):
+        if isinstance(result, Exception):
+            logger.debug("Bazaarvoice fast path failed for %s: %s", rurl, result)
+        elif result is not None:
+            resolved[rurl] = result
+    logger.info("Fast path resolved %s of %s review pages", len(resolved), len(urls))
+    return resolved
+
+
+async def scrape_lenovo_pdp(page: Page, url: str, fetched_at: Optional[str] = None) -> Dict[str, Any]:
+    await page.goto(url, wait_until="domcontentloaded")
+    await wait_for_ready(page, LENOVO_PDP_READY)
     
-    ld = await read_jsonld_from_dom(page)
-    prod = extract_product_from_jsonld(ld)
+    prod = await read_product_from_dom(page)
+    offers, agg = offer_fields_from_product(prod)
 
-    offers = {}
-    agg = {}
-    if prod:
-        offers = prod.get("offers") or {}
-        agg = prod.get("aggregateRating") or {}
+    # When JSON-LD already carries price and availability the popup dismissal
+    # and DOM selector fallbacks below are pure overhead
+    jsonld_complete = bool(offers.get("price") and offers.get("availability"))
 
     price_text = None
-    # Improved price selectors for Lenovo
-    price_selectors = [
-        "[data-test='pricingPrice']",
-        "[data-testid='pricingPrice']", 
-        "[data-testid='price']",
-        ".pricing-price",
-        ".price-current",
-        ".price",
-        ".final-price",
-        "[class*='price']",
-        "[data-price]"
-    ]
-    
-    for sel in price_selectors:
-        try:
-            el = page.locator(sel).first
-            if await el.is_visible():
-                price_text = await el.text_content()
-                if price_text and '$' in price_text:
-                    print(f"[DEBUG] Found price with selector {sel}: {price_text}")
-                    break
-        except Exception:
-            continue
-    
-    # Fallback: search for price patterns in page text
-    if not price_text:
+    if not jsonld_complete:
+        await wait_for_ready(page, LENOVO_PRICE_READY)
+
+        # Try to dismiss any popups/cookies
         try:
-            # Look for price patterns
-            price_patterns = [
-                r"text=/\$\s?\d[\d,]*\.?\d*/",
-                r"text=/USD\s*\$?\s*\d[\d,]*\.?\d*/",
-                r"text=/Price:\s*\$\d[\d,]*\.?\d*/"
-            ]
-            for pattern in price_patterns:
-                tel = page.locator(pattern).first
-                if await tel.is_visible():
-                    price_text = await tel.text_content()
-                    print(f"[DEBUG] Found price with pattern: {price_text}")
+            for sel in LENOVO_POPUP_SELECTORS:
+                popup = page.locator(sel).first
+                if await popup.is_visible():
+                    await popup.click()
+                    await popup.wait_for(state="hidden", timeout=1000)
                     break
         except Exception:
             pass
 
+        # Improved price selectors for Lenovo, probed in one evaluate
+        for sel, text in zip(LENOVO_PRICE_SELECTORS, await visible_texts(page, LENOVO_PRICE_SELECTORS)):
+            if text is None:
+                continue
+            price_text = text
+            if '$' in price_text:
+                logger.debug("Found price with selector %s: %s", sel, price_text)
+                break
+
+        # Fallback: search for price patterns in page text
+        if not price_text:
+            price_text = await first_visible_text(page, LENOVO_PRICE_TEXT_PATTERNS)
+            if price_text:
+                logger.debug("Found price with pattern: %s", price_text)
+
+    body_text = await read_body_text(page)
+
     # Improved availability detection
     availability = None
-    if offers and offers.get("availability"):
+    if offers.get("availability"):
         availability = str(offers.get("availability")).split("/")[-1]
 
     if not availability:
         # More comprehensive availability detection
-        availability_selectors = [
-            "[data-testid='availability']",
-            ".availability",
-            "[class*='stock']",
-            "[class*='availability']"
-        ]
-        
-        for sel in availability_selectors:
-            try:
-                el = page.locator(sel).first
-                if await el.is_visible():
-                    avail_text = await el.text_content()
-                    if avail_text:
-                        avail_lower = avail_text.lower()
-                        if any(term in avail_lower for term in ['in stock', 'available', 'add to cart']):
-                            availability = "InStock"
-                            break
-                        elif any(term in avail_lower for term in ['out of stock', 'unavailable', 'sold out']):
-                            availability = "OutOfStock"
-                            break
-            except Exception:
-                continue
+        for avail_text in await visible_texts(page, LENOVO_AVAILABILITY_SELECTORS):
+            availability = avail_text and classify_availability(avail_text)
+            if availability:
+                break
         
         # Fallback text-based detection
         if not availability:
-            for phrase, code in [
-                ("Add to cart", "InStock"),
-                ("Buy now", "InStock"),
-                ("In Stock", "InStock"),
-                ("Available", "InStock"),
-                ("Out of stock", "OutOfStock"),
-                ("Sold out", "OutOfStock"),
-                ("Temporarily unavailable", "OutOfStock"),
-                ("Discontinued", "Discontinued"),
-                ("Coming Soon", "PreOrder"),
-            ]:
-                try:
-                    if await page.get_by_text(phrase, exact=False).first.is_visible():
-                        availability = code
-                        print(f"[DEBUG] Found availability: {phrase} -> {code}")
-                        break
-                except Exception:
-                    continue
+            availability = availability_from_text(body_text, LENOVO_AVAILABILITY_RE, LENOVO_AVAILABILITY_NEEDLES)
+            logger.debug("Found availability from page text: %s", availability)
 
     # Improved shipping detection
     shipping_eta = None
-    shipping_selectors = [
-        "[data-testid='shipping']",
-        ".shipping-info",
-        ".delivery-info",
-        "[class*='shipping']",
-        "[class*='delivery']"
-    ]
-    
-    for sel in shipping_selectors:
-        try:
-            el = page.locator(sel).first
-            if await el.is_visible():
-                shipping_text = await el.text_content()
-                if shipping_text and any(term in shipping_text.lower() for term in ['ship', 'deliver', 'days', 'weeks']):
-                    shipping_eta = shipping_text.strip()
-                    print(f"[DEBUG] Found shipping info: {shipping_eta}")
-                    break
-        except Exception:
-            continue
+    for shipping_text in await visible_texts(page, LENOVO_SHIPPING_SELECTORS):
+        if shipping_text and any(term in shipping_text.lower() for term in SHIPPING_TERMS):
+            shipping_eta = shipping_text.strip()
+            logger.debug("Found shipping info: %s", shipping_eta)
+            break
     
     # Fallback shipping detection
     if not shipping_eta:
-        try:
-            ship_patterns = [
-                r"text=/Ships? in \d+[\s-]?\d*\s*(?:business\s*)?days?/i",
-                r"text=/Deliver(?:y|s) in \d+[\s-]?\d*\s*(?:business\s*)?days?/i",
-                r"text=/Free shipping/i",
-                r"text=/Ships? by/i"
-            ]
-            for pattern in ship_patterns:
-                ship_el = page.locator(pattern).first
-                if await ship_el.is_visible():
-                    shipping_eta = (await ship_el.text_content() or "").strip()
-                    if len(shipping_eta) < 100:  # Avoid grabbing long text
-                        print(f"[DEBUG] Found shipping pattern: {shipping_eta}")
-                        break
-        except Exception:
-            pass
+        m = LENOVO_SHIPPING_RE.search(body_text)
+        if m:
+            shipping_eta = m.group(0).strip()
+            logger.debug("Found shipping pattern: %s", shipping_eta)
 
-    promos = []
-    for t in [
-        "Weekly Deals", "Sale", "Save $", "Coupon", "Student Discount", "Free shipping",
-    ]:
-        try:
-            if await page.get_by_text(t, exact=False).first.is_visible():
-                promos.append(t)
-        except Exception:
-            continue
+    promos = promos_from_text(body_text, LENOVO_PROMO_RE, LENOVO_PROMO_NEEDLES)
 
-    price_val = offers.get("price") if isinstance(offers, dict) else None
+    price_val = offers.get("price")
     price = money_to_float(price_val) or money_to_float(price_text)
-    cur = offers.get("priceCurrency") if isinstance(offers, dict) else None
+    cur = offers.get("priceCurrency")
     currency = cur or pick_currency(price_val) or pick_currency(price_text)
 
-    agg_rating = None
-    agg_count = None
-    if agg:
-        agg_rating = agg.get("ratingValue")
-        agg_count = agg.get("reviewCount") or agg.get("ratingCount")
+    agg_rating, agg_count = aggregate_rating_fields(agg)
 
     return {
         "source_url": url,
@@ -286,78 +994,47 @@ async def scrape_lenovo_pdp(page: Page, url: str) -> Dict[str, Any]:
         "seller": "Lenovo",
         "aggregate_rating": agg_rating,
         "aggregate_review_count": agg_count,
-        "fetched_at": now_iso(),
+        "fetched_at": fetched_at or now_iso(),
     }
 
 
-async def scrape_hp_pdp(page: Page, url: str) -> Dict[str, Any]:
+async def scrape_hp_pdp(page: Page, url: str, fetched_at: Optional[str] = None) -> Dict[str, Any]:
     await page.goto(url, wait_until="domcontentloaded")
-    await page.wait_for_timeout(2000)
+    await wait_for_ready(page, HP_PDP_READY)
+
+    # HP PDPs embed a Product node too; prefer it over DOM probing
+    try:
+        offers, agg = offer_fields_from_product(await read_product_from_dom(page))
+    except Exception:
+        offers, agg = {}, {}
+
+    if not (offers.get("price") and offers.get("availability")):
+        await wait_for_ready(page, HP_PRICE_READY)
 
+    price_val = offers.get("price")
     price_text = None
-    for sel in [
-        "[data-automation-id='product-price']",
-        "[data-testid='price']",
-        "[data-automation='final-price']",
-        ".product-price",
-        ".price",
-    ]:
-        try:
-            el = page.locator(sel).first
-            if await el.is_visible():
-                price_text = await el.text_content()
-                break
-        except Exception:
-            continue
-    if not price_text:
-        try:
-            tel = page.locator(r"text=/\$\s?\d[\d,]*\.?\d*/").first
-            if await tel.is_visible():
-                price_text = await tel.text_content()
-        except Exception:
-            pass
+    if not money_to_float(price_val):
+        price_text = next((t for t in await visible_texts(page, HP_PRICE_SELECTORS) if t is not None), None)
+        if not price_text:
+            price_text = await locator_text(page, DOLLAR_PRICE_TEXT)
 
-    price = money_to_float(price_text)
-    currency = pick_currency(price_text)
+    price = money_to_float(price_val) or money_to_float(price_text)
+    currency = offers.get("priceCurrency") or pick_currency(price_val) or pick_currency(price_text)
+
+    body_text = await read_body_text(page)
 
     availability = "UNKNOWN"
-    try:
-        if await page.get_by_text("ADD TO CART", exact=False).first.is_visible():
-            availability = "IN_STOCK"
-        elif await page.get_by_text("Out of stock", exact=False).first.is_visible():
-            availability = "OUT_OF_STOCK"
-        elif await page.get_by_text("Customize & Buy", exact=False).first.is_visible():
-            availability = "CUSTOMIZABLE"
-    except Exception:
-        pass
+    if offers.get("availability"):
+        availability = hp_availability_code(str(offers.get("availability")).split("/")[-1])
+    else:
+        availability = availability_from_text(body_text, HP_AVAILABILITY_RE, HP_AVAILABILITY_NEEDLES) or availability
 
-    shipping_eta = None
-    try:
-        eta_el = page.locator(r"text=/Ships (in|by)|Delivery|Est\\. ship/i").first
-        if await eta_el.is_visible():
-            shipping_eta = (await eta_el.text_content() or "").strip()
-    except Exception:
-        pass
+    m = HP_SHIPPING_RE.search(body_text)
+    shipping_eta = m.group(0).strip() if m else None
 
-    promos = []
-    for t in ["FREE Storewide Shipping", "3% back in HP Rewards", "Weekly Deals", "Save $", "Instant rebate"]:
-        try:
-            if await page.get_by_text(t, exact=False).first.is_visible():
-                promos.append(t)
-        except Exception:
-            continue
+    promos = promos_from_text(body_text, HP_PROMO_RE, HP_PROMO_NEEDLES)
 
-    agg_rating = None
-    agg_count = None
-    try:
-        ld = await read_jsonld_from_dom(page)
-        prod = extract_product_from_jsonld(ld)
-        if prod:
-            agg = prod.get("aggregateRating") or {}
-            agg_rating = agg.get("ratingValue")
-            agg_count = agg.get("reviewCount") or agg.get("ratingCount")
-    except Exception:
-        pass
+    agg_rating, agg_count = aggregate_rating_fields(agg)
 
     return {
         "source_url": url,
@@ -369,216 +1046,60 @@ async def scrape_hp_pdp(page: Page, url: str) -> Dict[str, Any]:
         "seller": "HP",
         "aggregate_rating": agg_rating,
         "aggregate_review_count": agg_count,
-        "fetched_at": now_iso(),
+        "fetched_at": fetched_at or now_iso(),
     }
 
 
 async def scrape_hp_reviews_page(page: Page, url: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Dict[str, Any]]:
-    print(f"[DEBUG] Scraping HP reviews from: {url}")
+    logger.debug("Scraping HP reviews from: %s", url)
     await page.goto(url, wait_until="domcontentloaded")
+    # Every record from this page shares the page's scrape time
+    ts = now_iso()
     
-    # Wait for content to load and scroll to trigger any lazy loading
-    await page.wait_for_timeout(3000)
-    await page.mouse.wheel(0, 1200)
-    await page.wait_for_timeout(2000)
+    # Wait for review markup; only scroll to trigger lazy loading if it is not there yet
+    if not await wait_for_ready(page, HP_REVIEWS_READY):
+        await page.mouse.wheel(0, 1200)
+        await wait_for_ready(page, HP_REVIEWS_READY)
     
     # Try to click "Load more reviews" or similar buttons
     try:
-        load_more_selectors = [
-            "button:has-text('Show more')",
-            "button:has-text('Load more')",
-            "button:has-text('View all')",
-            ".load-more",
-            "[data-testid='load-more']"
-        ]
-        for selector in load_more_selectors:
+        for selector in HP_LOAD_MORE_SELECTORS:
             try:
                 button = page.locator(selector).first
                 if await button.is_visible():
                     await button.click()
-                    await page.wait_for_timeout(2000)
+                    await wait_for_network_idle(page)
                     break
             except Exception:
                 continue
     except Exception:
         pass
 
-    aggregate = {"source_url": url, "fetched_at": now_iso()}
-    text = await page.locator("body").inner_text()
-    
-    # Extract aggregate ratings with more patterns
-    rating_patterns = [
-        r"([0-5]\.?[0-9]?)\s*out of\s*5",
-        r"([0-5]\.?[0-9]?)\s*/\s*5",
-        r"Rating:\s*([0-5]\.?[0-9]?)",
-        r"([0-5]\.?[0-9]?)\s*stars?"
-    ]
-    for pattern in rating_patterns:
-        m = re.search(pattern, text, re.I)
-        if m:
-            aggregate["aggregate_rating"] = float(m.group(1))
-            break
-    
-    # Extract review count with more patterns
-    count_patterns = [
-        r"(\d{1,4})\s+reviews?",
-        r"(\d{1,4})\s+customer reviews?",
-        r"Based on\s+(\d{1,4})\s+reviews?",
-        r"(\d{1,4})\s+ratings?"
-    ]
-    for pattern in count_patterns:
-        m2 = re.search(pattern, text, re.I)
-        if m2:
-            aggregate["aggregate_review_count"] = int(m2.group(1))
-            break
+    aggregate = {"source_url": url, "fetched_at": ts}
+    # Read the rating summary widget; fall back to the whole page text only
+    # when it is missing or carries no rating
+    summary = await read_scoped_text(page, HP_RATING_SUMMARY_SELECTORS)
+    found = review_aggregate_from_text(summary) if summary else {}
+    if "aggregate_rating" not in found:
+        found = review_aggregate_from_text(await read_dom_text(page))
+    aggregate.update(found)
 
     reviews: List[Dict[str, Any]] = []
     
-    # Expanded selectors for HP reviews
-    review_selectors = [
-        ".review",
-        ".bv-content-item", 
-        "[data-bv-review-id]",
-        "article",
-        ".review-item",
-        ".customer-review",
-        ".product-review",
-        "[data-testid='review']",
-        ".bv-content-review",
-        ".review-card"
-    ]
-    
-    cards = None
-    for selector in review_selectors:
-        cards = page.locator(selector)
-        cnt = await cards.count()
-        if cnt > 0:
-            print(f"[DEBUG] Found {cnt} review elements with selector: {selector}")
-            break
-    
+    # One evaluate finds the card selector and reads every field of every card
+    cards = await read_card_fields(page, HP_REVIEW_CARDS, HP_REVIEW_FIELDS, 50)
     if not cards:
-        print("[DEBUG] No review elements found with any selector")
-        return reviews, [], aggregate
+        logger.debug("No review elements found with any selector")
     
-    cnt = await cards.count()
-    print(f"[DEBUG] Processing {min(cnt, 50)} review cards")
+    logger.debug("Processing %s review cards", len(cards))
     
-    for i in range(min(cnt, 50)):  # Reduced to 50 for faster processing
-        c = cards.nth(i)
-        rating = None
-        
-        # Multiple strategies for rating extraction
-        rating_selectors = [
-            "[aria-label*='out of 5']",
-            "[aria-label*='stars']", 
-            ".rating",
-            ".bv-off-screen",
-            ".star-rating",
-            "[data-rating]",
-            ".review-rating"
-        ]
-        
-        for sel in rating_selectors:
-            try:
-                el = c.locator(sel).first
-                if await el.is_visible():
-                    # Try aria-label first
-                    aria_label = await el.get_attribute("aria-label")
-                    if aria_label:
-                        mm = re.search(r"([0-5]\.?[0-9]?)\s*(?:out of 5|stars?)", aria_label, re.I)
-                        if mm:
-                            rating = float(mm.group(1))
-                            break
-                    
-                    # Try data-rating attribute
-                    data_rating = await el.get_attribute("data-rating")
-                    if data_rating and data_rating.replace(".", "").isdigit():
-                        rating = float(data_rating)
-                        break
-                    
-                    # Try text content
-                    rtxt = await el.text_content()
-                    if rtxt:
-                        mm2 = re.search(r"([0-5]\.?[0-9]?)\s*(?:out of 5|stars?|/5)", rtxt, re.I)
-                        if mm2:
-                            rating = float(mm2.group(1))
-                            break
-            except Exception as e:
-                continue
-        
-        # Extract review content with multiple selectors
-        body = None
-        body_selectors = [
-            ".bv-content-review-text",
-            ".content", 
-            ".review-body",
-            "[itemprop='reviewBody']",
-            ".review-text",
-            ".review-content",
-            ".customer-review-text"
-        ]
-        
-        for sel in body_selectors:
-            try:
-                el = c.locator(sel).first
-                if await el.is_visible():
-                    body = await el.text_content()
-                    if body and len(body.strip()) > 10:  # Ensure meaningful content
-                        break
-            except Exception:
-                continue
-        
-        # Extract title
-        title = None
-        title_selectors = [
-            ".review-title",
-            ".bv-content-title", 
-            "[itemprop='name']",
-            ".review-headline",
-            ".review-summary",
-            "h3", "h4", "h5"
-        ]
-        
-        for sel in title_selectors:
-            try:
-                el = c.locator(sel).first
-                if await el.is_visible():
-                    title = await el.text_content()
-                    if title and len(title.strip()) > 3:
-                        break
-            except Exception:
-                continue
-        
-        # Extract author
-        author = None
-        author_selectors = [
-            ".bv-author",
-            ".review-author", 
-            "[itemprop='author']",
-            ".reviewer-name",
-            ".customer-name"
-        ]
-        
-        for sel in author_selectors:
-            try:
-                el = c.locator(sel).first
-                if await el.is_visible():
-                    author = await el.text_content()
-                    if author and len(author.strip()) > 1:
-                        break
-            except Exception:
-                continue
-        
-        # Extract date
-        date = None
-        try:
-            time_el = c.locator("time, [itemprop='datePublished'], .review-date, .date").first
-            if await time_el.is_visible():
-                date = await time_el.get_attribute("datetime")
-                if not date:
-                    date = await time_el.text_content()
-        except Exception:
-            pass
+    for card in cards:
+        rating = rating_from_candidates(card["rating"])
+        body = text_from_candidates(card["body"], 10)
+        title = text_from_candidates(card["title"], 3)
+        author = text_from_candidates(card["author"], 1)
+        time_el = card["date"][0]
+        date = (time_el["datetime"] or time_el["text"]) if time_el else None
 
         # Only add review if we have meaningful content
         if rating is not None or (body and len(body.strip()) > 10) or (title and len(title.strip()) > 3):
@@ -589,302 +1110,84 @@ async def scrape_hp_reviews_page(page: Page, url: str) -> Tuple[List[Dict[str, A
                 "body": body.strip() if body else None,
                 "author": author.strip() if author else None,
                 "date": (date.strip() if isinstance(date, str) and date else date),
-                "fetched_at": now_iso(),
+                "fetched_at": ts,
             })
 
-    print(f"[DEBUG] Extracted {len(reviews)} reviews")
+    logger.debug("Extracted %s reviews", len(reviews))
 
     # QnA extraction with improved selectors
     qna: List[Dict[str, Any]] = []
-    qna_selectors = [
-        ".qa",
-        ".question", 
-        ".bv-question",
-        "[data-bv-question-id]",
-        ".q-and-a",
-        ".faq-item",
-        ".question-answer"
-    ]
-    
-    qblocks = None
-    for selector in qna_selectors:
-        qblocks = page.locator(selector)
-        qcnt = await qblocks.count()
-        if qcnt > 0:
-            print(f"[DEBUG] Found {qcnt} QnA elements with selector: {selector}")
-            break
-    
-    if qblocks:
-        qcnt = await qblocks.count()
-        for i in range(min(qcnt, 20)):  # Limit QnA to 20 items
-            q = qblocks.nth(i)
-            qtxt = None
-            ans = None
-            
-            # Question extraction
-            question_selectors = [
-                ".question-text",
-                ".bv-question-summary", 
-                ".bv-content-summary-body",
-                "[itemprop='question']",
-                ".question-content",
-                ".q-text"
-            ]
-            
-            for sel in question_selectors:
-                try:
-                    el = q.locator(sel).first
-                    if await el.is_visible():
-                        qtxt = await el.text_content()
-                        if qtxt and len(qtxt.strip()) > 5:
-                            break
-                except Exception:
-                    continue
-            
-            # Answer extraction
-            answer_selectors = [
-                ".answer",
-                ".bv-answer", 
-                "[data-bv-answer-id]",
-                "[itemprop='acceptedAnswer']",
-                ".answer-text",
-                ".a-text"
-            ]
-            
-            for sel in answer_selectors:
-                try:
-                    el = q.locator(sel).first
-                    if await el.is_visible():
-                        ans = await el.text_content()
-                        if ans and len(ans.strip()) > 5:
-                            break
-                except Exception:
-                    continue
-            
-            if qtxt or ans:
-                qna.append({
-                    "source_url": url,
-                    "question": qtxt.strip() if qtxt else None,
-                    "answer": ans.strip() if ans else None,
-                    "fetched_at": now_iso(),
-                })
+    for block in await read_card_fields(page, HP_QNA_CARDS, HP_QNA_FIELDS, 20):
+        qtxt = text_from_candidates(block["question"], 5)
+        ans = text_from_candidates(block["answer"], 5)
+        if qtxt or ans:
+            qna.append({
+                "source_url": url,
+                "question": qtxt.strip() if qtxt else None,
+                "answer": ans.strip() if ans else None,
+                "fetched_at": ts,
+            })
     
-    print(f"[DEBUG] Extracted {len(qna)} QnA items")
+    logger.debug("Extracted %s QnA items", len(qna))
     return reviews, qna, aggregate
 
 
 async def scrape_lenovo_reviews_page(page: Page, url: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Dict[str, Any]]:
     """Scrape Lenovo reviews from product pages or dedicated review pages"""
-    print(f"[DEBUG] Scraping Lenovo reviews from: {url}")
-    await page.goto(url, wait_until="domcontentloaded")
-    await page.wait_for_timeout(3000)
+    logger.debug("Scraping Lenovo reviews from: %s", url)
+    await goto_document(page, url)
+    # Every record from this page shares the page's scrape time
+    ts = now_iso()
+    await wait_for_ready(page, LENOVO_REVIEWS_TAB_READY)
     
     # Click on the "Ratings & Reviews" tab using the exact selector from your HTML
     try:
         # First try the exact selector from your provided HTML
-        reviews_tab = page.locator('button[data-tkey="ratingsReviews"]').first
+        reviews_tab = page.locator(LENOVO_REVIEWS_TAB).first
         if await reviews_tab.is_visible():
-            print("[DEBUG] Found Ratings & Reviews tab, clicking...")
+            logger.debug("Found Ratings & Reviews tab, clicking...")
             await reviews_tab.click()
-            await page.wait_for_timeout(3000)
+            await wait_for_ready(page, LENOVO_REVIEWS_READY)
         else:
             # Fallback selectors
-            review_tab_selectors = [
-                'button[aria-label*="Ratings"]',
-                'button[aria-label*="Reviews"]',
-                "button:has-text('Reviews')",
-                "a:has-text('Reviews')",
-                "[data-tab='reviews']",
-                ".reviews-tab",
-                "#reviews-tab"
-            ]
-            for selector in review_tab_selectors:
+            for selector in LENOVO_REVIEWS_TAB_FALLBACKS:
                 try:
                     tab = page.locator(selector).first
                     if await tab.is_visible():
-                        print(f"[DEBUG] Found reviews tab with selector: {selector}")
+                        logger.debug("Found reviews tab with selector: %s", selector)
                         await tab.click()
-                        await page.wait_for_timeout(2000)
+                        await wait_for_ready(page, LENOVO_REVIEWS_READY, timeout=2000)
                         break
                 except Exception:
                     continue
     except Exception as e:
-        print(f"[DEBUG] Error clicking reviews tab: {e}")
+        logger.debug("Error clicking reviews tab: %s", e)
     
-    # Scroll to load reviews
-    await page.mouse.wheel(0, 1500)
-    await page.wait_for_timeout(2000)
+    # Scroll to trigger lazy loading only if the review widget is not there yet
+    if not await wait_for_ready(page, LENOVO_REVIEWS_READY, timeout=500):
+        await page.mouse.wheel(0, 1500)
+        await wait_for_ready(page, LENOVO_REVIEWS_READY, timeout=2000)
     
-    aggregate = {"source_url": url, "fetched_at": now_iso()}
-    text = await page.locator("body").inner_text()
+    aggregate = {"source_url": url, "fetched_at": ts}
     
     # Extract aggregate data
-    rating_patterns = [
-        r"([0-5]\.?[0-9]?)\s*out of\s*5",
-        r"([0-5]\.?[0-9]?)\s*/\s*5",
-        r"Rating:\s*([0-5]\.?[0-9]?)",
-        r"([0-5]\.?[0-9]?)\s*stars?"
-    ]
-    for pattern in rating_patterns:
-        m = re.search(pattern, text, re.I)
-        if m:
-            aggregate["aggregate_rating"] = float(m.group(1))
-            break
-    
-    count_patterns = [
-        r"(\d{1,4})\s+reviews?",
-        r"(\d{1,4})\s+customer reviews?",
-        r"Based on\s+(\d{1,4})\s+reviews?",
-        r"(\d{1,4})\s+ratings?"
-    ]
-    for pattern in count_patterns:
-        m2 = re.search(pattern, text, re.I)
-        if m2:
-            aggregate["aggregate_review_count"] = int(m2.group(1))
-            break
+    aggregate.update(review_aggregate_from_text(await read_dom_text(page)))
     
     reviews: List[Dict[str, Any]] = []
     
-    # Lenovo review selectors - try broader approach first
-    review_selectors = [
-        "div[data-bv-v='contentItem']",           # Content items from your HTML
-        "div[class*='bv-rmr_sc-16dr711']",        # Any div with this class pattern
-        "[class*='jEfJcJ']",                      # The specific class from your screenshot
-        "section[id='bv-reviews_container'] div", # Any div inside reviews container
-    ]
-    
-    cards = None
-    for selector in review_selectors:
-        cards = page.locator(selector)
-        cnt = await cards.count()
-        if cnt > 0:
-            print(f"[DEBUG] Found {cnt} Lenovo review elements with selector: {selector}")
-            break
-    
-    # If no cards found with CSS selectors, try XPath
-    if not cards or await cards.count() == 0:
-        print("[DEBUG] Trying XPath selectors for Lenovo reviews...")
-        xpath_selectors = [
-            "//div[contains(@class, 'bv-rmr_sc') and contains(@class, '16dr711')]",  # Based on your screenshot
-            "//section[contains(@id, 'bv-review')]",
-            "//div[contains(@data-bv-v, 'contentitem')]"
-        ]
-        
-        for xpath in xpath_selectors:
-            cards = page.locator(f"xpath={xpath}")
-            cnt = await cards.count()
-            if cnt > 0:
-                print(f"[DEBUG] Found {cnt} Lenovo review elements with XPath: {xpath}")
-                break
-    
+    cards = await read_card_fields(page, LENOVO_REVIEW_CARDS, LENOVO_REVIEW_FIELDS, 30)
     if not cards:
-        print("[DEBUG] No Lenovo review elements found")
-        return reviews, [], aggregate
+        logger.debug("No Lenovo review elements found")
     
-    cnt = await cards.count()
-    print(f"[DEBUG] Processing {min(cnt, 30)} Lenovo review cards")
+    logger.debug("Processing %s Lenovo review cards", len(cards))
     
-    for i in range(min(cnt, 30)):
-        c = cards.nth(i)
-        rating = None
-        
-        # Extract rating - from your NEW screenshot
-        rating_selectors = [
-            "div[class*='bv-rmr_sc-16dr711-19'][class*='dzPMOO']",  # Rating from your screenshot  
-            "div[aria-label*='out of 5']",                          # Aria label rating
-            "div[class*='bv-rmr_sc-16dr711-1']"                     # Fallback
-        ]
-        
-        for sel in rating_selectors:
-            try:
-                el = c.locator(sel).first
-                if await el.is_visible():
-                    aria_label = await el.get_attribute("aria-label")
-                    if aria_label:
-                        mm = re.search(r"([0-5]\.?[0-9]?)\s*(?:out of 5|stars?)", aria_label, re.I)
-                        if mm:
-                            rating = float(mm.group(1))
-                            break
-                    
-                    data_rating = await el.get_attribute("data-rating")
-                    if data_rating and data_rating.replace(".", "").isdigit():
-                        rating = float(data_rating)
-                        break
-                    
-                    rtxt = await el.text_content()
-                    if rtxt:
-                        mm2 = re.search(r"([0-5]\.?[0-9]?)\s*(?:out of 5|stars?|/5)", rtxt, re.I)
-                        if mm2:
-                            rating = float(mm2.group(1))
-                            break
-            except Exception:
-                continue
-        
-        # Extract review body - from your NEW screenshot
-        body = None
-        body_selectors = [
-            "div[class*='bv-rmr_sc-16dr711-13'][class*='fNeoZ']",  # Review text from your screenshot
-            "div[data-bv-v='contentSummary']",                     # Content summary from your HTML
-            "div[class*='bv-rmr_sc-16dr711-13']"                   # Fallback
-        ]
-        
-        for sel in body_selectors:
-            try:
-                el = c.locator(sel).first
-                if await el.is_visible():
-                    body = await el.text_content()
-                    if body and len(body.strip()) > 10:
-                        break
-            except Exception:
-                continue
-        
-        # Extract title - from your NEW screenshot
-        title = None
-        title_selectors = [
-            "div[class*='bv-rmr_sc-16dr711-14'][class*='fKaKqJ']",  # Title from your screenshot
-            "div[data-bv-v='contentHeader']",                       # Header from your HTML
-            "div[class*='bv-rmr_sc-16dr711-14']"                    # Fallback
-        ]
-        
-        for sel in title_selectors:
-            try:
-                el = c.locator(sel).first
-                if await el.is_visible():
-                    title = await el.text_content()
-                    if title and len(title.strip()) > 3:
-                        break
-            except Exception:
-                continue
-        
-        # Extract author
-        author = None
-        author_selectors = [
-            ".review-author",
-            ".reviewer-name", 
-            ".customer-name",
-            "[itemprop='author']"
-        ]
-        
-        for sel in author_selectors:
-            try:
-                el = c.locator(sel).first
-                if await el.is_visible():
-                    author = await el.text_content()
-                    if author and len(author.strip()) > 1:
-                        break
-            except Exception:
-                continue
-        
-        # Extract date
-        date = None
-        try:
-            time_el = c.locator("time, [itemprop='datePublished'], .review-date, .date").first
-            if await time_el.is_visible():
-                date = await time_el.get_attribute("datetime")
-                if not date:
-                    date = await time_el.text_content()
-        except Exception:
-            pass
+    for card in cards:
+        rating = rating_from_candidates(card["rating"])
+        body = text_from_candidates(card["body"], 10)
+        title = text_from_candidates(card["title"], 3)
+        author = text_from_candidates(card["author"], 1)
+        time_el = card["date"][0]
+        date = (time_el["datetime"] or time_el["text"]) if time_el else None
         
         if rating is not None or (body and len(body.strip()) > 10) or (title and len(title.strip()) > 3):
             reviews.append({
@@ -894,227 +1197,520 @@ async def scrape_lenovo_reviews_page(page: Page, url: str) -> Tuple[List[Dict[st
                 "body": body.strip() if body else None,
                 "author": author.strip() if author else None,
                 "date": (date.strip() if isinstance(date, str) and date else date),
-                "fetched_at": now_iso(),
+                "fetched_at": ts,
             })
     
-    print(f"[DEBUG] Extracted {len(reviews)} Lenovo reviews")
+    logger.debug("Extracted %s Lenovo reviews", len(reviews))
     if len(reviews) > 0:
-        print(f"[DEBUG] Sample review: {reviews[0]}")
-    else:
-        print("[DEBUG] No reviews found - checking page content...")
+        logger.debug("Sample review: %s", reviews[0])
+    elif logger.isEnabledFor(logging.DEBUG):
+        # Pulls the whole page text, so only when debug output is wanted
+        logger.debug("No reviews found - checking page content...")
         page_text = await page.locator("body").inner_text()
         if "ThinkPad" in page_text:
-            print("[DEBUG] Page loaded correctly (contains ThinkPad)")
+            logger.debug("Page loaded correctly (contains ThinkPad)")
         if "review" in page_text.lower():
-            print("[DEBUG] Page contains 'review' text")
+            logger.debug("Page contains 'review' text")
         if "rating" in page_text.lower():
-            print("[DEBUG] Page contains 'rating' text")
+            logger.debug("Page contains 'rating' text")
     
     # Now click on Q&A tab to get questions and answers
     qna: List[Dict[str, Any]] = []
     try:
         # Click on "Questions & Answers" tab using the exact selector from your HTML
-        qna_tab = page.locator('button[data-tkey="questionsAndAnswers"]').first
+        qna_tab = page.locator(LENOVO_QNA_TAB).first
         if await qna_tab.is_visible():
-            print("[DEBUG] Found Questions & Answers tab, clicking...")
+            logger.debug("Found Questions & Answers tab, clicking...")
             await qna_tab.click()
-            await page.wait_for_timeout(3000)
-            
-            # Scroll to load Q&A content
-            await page.mouse.wheel(0, 1000)
-            await page.wait_for_timeout(2000)
+
+            # Scroll to load Q&A content only if it did not render on its own
+            if not await wait_for_ready(page, LENOVO_QNA_READY, timeout=2000):
+                await page.mouse.wheel(0, 1000)
+                await wait_for_network_idle(page, timeout=3000)
             
             # Extract Q&A with Lenovo-specific selectors
-            qna_selectors = [
-                ".qa",
-                ".question", 
-                ".bv-question",
-                "[data-bv-question-id]",
-                ".q-and-a",
-                ".faq-item",
-                ".question-answer",
-                ".review-qa"  # Lenovo specific
-            ]
-            
-            qblocks = None
-            for selector in qna_selectors:
-                qblocks = page.locator(selector)
-                qcnt = await qblocks.count()
-                if qcnt > 0:
-                    print(f"[DEBUG] Found {qcnt} Lenovo QnA elements with selector: {selector}")
-                    break
-            
-            if qblocks:
-                qcnt = await qblocks.count()
-                for i in range(min(qcnt, 15)):  # Limit to 15 Q&A items
-                    q = qblocks.nth(i)
-                    qtxt = None
-                    ans = None
-                    
-                    # Question extraction with Lenovo-specific selectors
-                    question_selectors = [
-                        ".question-text",
-                        ".bv-question-summary", 
-                        ".bv-content-summary-body",
-                        "[itemprop='question']",
-                        ".question-content",
-                        ".q-text",
-                        ".qa-question"
-                    ]
-                    
-                    for sel in question_selectors:
-                        try:
-                            el = q.locator(sel).first
-                            if await el.is_visible():
-                                qtxt = await el.text_content()
-                                if qtxt and len(qtxt.strip()) > 5:
-                                    break
-                        except Exception:
-                            continue
-                    
-                    # Answer extraction with Lenovo-specific selectors
-                    answer_selectors = [
-                        ".answer",
-                        ".bv-answer", 
-                        "[data-bv-answer-id]",
-                        "[itemprop='acceptedAnswer']",
-                        ".answer-text",
-                        ".a-text",
-                        ".qa-answer"
-                    ]
-                    
-                    for sel in answer_selectors:
-                        try:
-                            el = q.locator(sel).first
-                            if await el.is_visible():
-                                ans = await el.text_content()
-                                if ans and len(ans.strip()) > 5:
-                                    break
-                        except Exception:
-                            continue
-                    
-                    if qtxt or ans:
-                        qna.append({
-                            "source_url": url,
-                            "question": qtxt.strip() if qtxt else None,
-                            "answer": ans.strip() if ans else None,
-                            "fetched_at": now_iso(),
-                        })
+            for block in await read_card_fields(page, LENOVO_QNA_CARDS, LENOVO_QNA_FIELDS, 15):
+                qtxt = text_from_candidates(block["question"], 5)
+                ans = text_from_candidates(block["answer"], 5)
+                if qtxt or ans:
+                    qna.append({
+                        "source_url": url,
+                        "question": qtxt.strip() if qtxt else None,
+                        "answer": ans.strip() if ans else None,
+                        "fetched_at": ts,
+                    })
         else:
-            print("[DEBUG] Q&A tab not found")
+            logger.debug("Q&A tab not found")
     except Exception as e:
-        print(f"[DEBUG] Error extracting Q&A: {e}")
+        logger.debug("Error extracting Q&A: %s", e)
     
-    print(f"[DEBUG] Extracted {len(qna)} Lenovo Q&A items")
+    logger.debug("Extracted %s Lenovo Q&A items", len(qna))
     return reviews, qna, aggregate
 
 
-@retry(stop=stop_after_attempt(3), wait=wait_fixed(1))
+@retry(stop=stop_after_attempt(3), wait=wait_exponential_jitter(initial=0.2, max=2.0))
 async def get_browser(play):
-    # Try mitigating HTTP/2 issues by disabling http2 and setting realistic headers via context
+    # A long-lived browser server (`playwright launch-server`) skips Chromium startup
+    ws_endpoint = os.getenv("PW_WS")
+    if ws_endpoint:
+        try:
+            return await play.chromium.connect(ws_endpoint)
+        except Exception as e:
+            logger.warning("Could not connect to browser server %s, launching locally: %s", ws_endpoint, e)
+    # HTTP/2 stays enabled so subresources multiplex over one connection;
+    # realistic headers are set per context
     browser = await play.chromium.launch(headless=True, args=[
-        "--disable-http2",
         "--no-sandbox",
         "--disable-dev-shm-usage",
     ])
     return browser
 
 
-async def main():
-    offers: Dict[str, List[Dict[str, Any]]] = {k: [] for k in TARGETS}
-    reviews_map: Dict[str, List[Dict[str, Any]]] = {k: [] for k in TARGETS}
-    qna_map: Dict[str, List[Dict[str, Any]]] = {k: [] for k in TARGETS}
-
-    async with async_playwright() as play:
-        browser = await get_browser(play)
-        context = await browser.new_context(
-            user_agent=(
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                "(KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36"
-            ),
-            locale="en-US",
-            timezone_id="America/New_York",
-            extra_http_headers={
-                "Accept-Language": "en-US,en;q=0.9",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
-                "Upgrade-Insecure-Requests": "1",
-            },
-        )
-        page = await context.new_page()
+# Scrapers and text conventions for each store origin
+HOST_SCRAPERS = {
+    "www.lenovo.com": {
+        "seller": "Lenovo",
+        "scrape_pdp": scrape_lenovo_pdp,
+        "scrape_reviews": scrape_lenovo_reviews_page,
+        "availability": str,
+        "shipping_re": LENOVO_SHIPPING_RE,
+        "promo_re": LENOVO_PROMO_RE,
+        "promo_needles": LENOVO_PROMO_NEEDLES,
+    },
+    "www.hp.com": {
+        "seller": "HP",
+        "scrape_pdp": scrape_hp_pdp,
+        "scrape_reviews": scrape_hp_reviews_page,
+        "availability": hp_availability_code,
+        "shipping_re": HP_SHIPPING_RE,
+        "promo_re": HP_PROMO_RE,
+        "promo_needles": HP_PROMO_NEEDLES,
+    },
+}
 
-        # Scrape Lenovo product pages
-        for key in ["lenovo_e14_intel", "lenovo_e14_amd"]:
-            url = TARGETS[key]["pdp"]
-            try:
-                data = await scrape_lenovo_pdp(page, url)
-                offers[key].append(data)
-            except Exception as e:
-                print(f"[WARN] Lenovo scrape failed for {key}: {e}")
-
-        # Scrape HP product pages
-        for key in ["hp_probook_440", "hp_probook_450"]:
-            url = TARGETS[key]["pdp"]
-            try:
-                data = await scrape_hp_pdp(page, url)
-                offers[key].append(data)
-            except Exception as e:
-                print(f"[WARN] HP PDP scrape failed for {key}: {e}")
-
-        # Scrape Lenovo reviews from dedicated review URLs with #reviews fragment
-        for key in ["lenovo_e14_intel", "lenovo_e14_amd"]:
-            for rurl in TARGETS[key]["reviews"]:
+CONTEXT_OPTIONS = {
+    "user_agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36"
+    ),
+    "locale": "en-US",
+    "timezone_id": "America/New_York",
+    "extra_http_headers": {
+        "Accept-Language": "en-US,en;q=0.9",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
+        "Upgrade-Insecure-Requests": "1",
+    },
+}
+
+
+# Subresources the scrapers never read; aborting them shrinks page loads.
+# Stylesheets stay: the selector probes skip hidden elements, and without CSS
+# every display:none price/tab/popup would look visible.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+BLOCKED_TRACKER_HOSTS = ("doubleclick", "google-analytics", "segment.io", "adobedtm")
+
+
+async def block_heavy_resources(route: Route) -> None:
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+        return
+    host = urlparse(request.url).netloc
+    if any(tracker in host for tracker in BLOCKED_TRACKER_HOSTS):
+        await route.abort()
+        return
+    await route.continue_()
+
+
+def group_targets_by_host(targets: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Split targets by the origin of their PDP URL."""
+    by_host: Dict[str, Dict[str, Dict[str, Any]]] = defaultdict(dict)
+    for key, target in targets.items():
+        by_host[urlparse(target["pdp"]).netloc][key] = target
+    return dict(by_host)
+
+
+class JsonlWriter:
+    """Streams keyed records to a JSONL file, one ``{"key": ..., **record}`` per line.
+
+    Lines go to a sibling ``.tmp`` file that replaces the target only when the
+    block exits cleanly with at least one record, so a failed or empty run
+    keeps the previous file.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.count = 0
+        self._tmp = path.with_name(path.name + ".tmp")
+        self._fp = None
+
+    def __enter__(self) -> "JsonlWriter":
+        self._tmp.parent.mkdir(parents=True, exist_ok=True)
+        self._fp = self._tmp.open("wb")
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._fp.close()
+        if exc_type is None and self.count:
+            self._tmp.replace(self.path)
+        else:
+            self._tmp.unlink()
+
+    def write(self, key: str, records: List[Dict[str, Any]]) -> None:
+        for record in records:
+            self._fp.write(json_codec.dumps({"key": key, **record}, newline=True))
+        self.count += len(records)
+
+
+class ResultCache:
+    """Browser scrape results per (scraper, URL), reused for ``ttl`` seconds.
+
+    The entry is the scrape task itself, so concurrent callers for the same
+    URL share one navigation instead of each loading the page. Failed scrapes
+    are dropped so the next caller retries. Every caller gets its own deep copy,
+    so one target merging into its result never changes what the next one sees.
+    Entries live as long as the ``Scraper`` that owns the cache, so only repeated
+    ``run_once`` calls on one scraper hit it across runs.
+    """
+
+    def __init__(self, ttl: float = RESULT_TTL):
+        self.ttl = ttl
+        self._entries: Dict[Tuple[str, str], Tuple[float, asyncio.Future]] = {}
+
+    async def get_or_scrape(self, scrape, page: Page, url: str, *args: Any) -> Any:
+        key = (scrape.__name__, url)
+        entry = self._entries.get(key)
+        if entry and time.monotonic() - entry[0] < self.ttl:
+            logger.debug("Reusing %s result for %s", scrape.__name__, url)
+            return copy.deepcopy(await entry[1])
+        task = asyncio.ensure_future(scrape(page, url, *args))
+        self._entries[key] = (time.monotonic(), task)
+        try:
+            return copy.deepcopy(await task)
+        except Exception:
+            self._entries.pop(key, None)
+            raise
+
+
+class PagePool:
+    """Idle pages of one context, handed to the next target instead of reopened.
+
+    Pages are created lazily, so the pool never holds more pages than were
+    open at once under the caller's semaphore. Closing the context closes them.
+    """
+
+    def __init__(self, context):
+        self._context = context
+        self._idle: List[Page] = []
+
+    async def acquire(self) -> Page:
+        while self._idle:
+            page = self._idle.pop()
+            if not page.is_closed():
+                return page
+        return await self._context.new_page()
+
+    def release(self, page: Page) -> None:
+        if not page.is_closed():
+            self._idle.append(page)
+
+
+def merge_review_aggregate(key_offers: List[Dict[str, Any]], agg: Dict[str, Any]) -> None:
+    """Backfill the first offer's aggregate rating/count from a reviews page."""
+    if not agg or not key_offers:
+        return
+    o = key_offers[0]
+    if agg.get("aggregate_rating") and not o.get("aggregate_rating"):
+        o["aggregate_rating"] = agg.get("aggregate_rating")
+    if agg.get("aggregate_review_count") and not o.get("aggregate_review_count"):
+        o["aggregate_review_count"] = agg.get("aggregate_review_count")
+
+
+def write_prefetched_reviews(
+    targets: Dict[str, Dict[str, Any]],
+    prefetched: Dict[str, ReviewsPage],
+    offers: Dict[str, List[Dict[str, Any]]],
+    reviews_out: JsonlWriter,
+    qna_out: JsonlWriter,
+) -> None:
+    """Write the review pages the fast path resolved, for runs without a browser."""
+    for key, target in targets.items():
+        for rurl in dict.fromkeys(target["reviews"]):
+            if rurl in prefetched:
+                rvs, qa, agg = prefetched[rurl]
+                merge_review_aggregate(offers[key], agg)
+                reviews_out.write(key, rvs)
+                qna_out.write(key, qa)
+
+
+async def scrape_reviews_recording(
+    page: Page, url: str, profile: Dict[str, Any], results: ResultCache, endpoints: bazaarvoice.EndpointStore
+) -> ReviewsPage:
+    """Browser-scrape a review page, noting the Bazaarvoice API URLs it loads for later fast runs.
+
+    Endpoints are only kept when they cover what the browser found, so a page
+    whose Q&A came from markup keeps going through the browser.
+    """
+    captured: Dict[str, str] = {}
+
+    def on_response(response) -> None:
+        kind = bazaarvoice.endpoint_kind(response.url)
+        if kind and response.ok:
+            captured.setdefault(kind, response.url)
+
+    page.on("response", on_response)
+    try:
+        rvs, qa, agg = await results.get_or_scrape(profile["scrape_reviews"], page, url)
+    finally:
+        page.remove_listener("response", on_response)
+    if "reviews" in captured and ("questions" in captured or not qa):
+        endpoints.record(url, captured)
+    return rvs, qa, agg
+
+
+async def scrape_target(
+    pages: PagePool,
+    sem: asyncio.Semaphore,
+    profile: Dict[str, Any],
+    key: str,
+    target: Dict[str, Any],
+    run_ts: str,
+    results: ResultCache,
+    offers: Dict[str, List[Dict[str, Any]]],
+    reviews_out: JsonlWriter,
+    qna_out: JsonlWriter,
+    prefetched: Dict[str, ReviewsPage],
+    endpoints: bazaarvoice.EndpointStore,
+) -> None:
+    """Scrape one target's PDP and review pages, skipping what the fast paths already resolved."""
+    async with sem:
+        page: Optional[Page] = None
+        try:
+            if not offers[key]:
+                page = await pages.acquire()
                 try:
-                    rvs, qa, agg = await scrape_lenovo_reviews_page(page, rurl)
-                    if agg and offers[key]:
-                        o = offers[key][0]
-                        if agg.get("aggregate_rating") and not o.get("aggregate_rating"):
-                            o["aggregate_rating"] = agg.get("aggregate_rating")
-                        if agg.get("aggregate_review_count") and not o.get("aggregate_review_count"):
-                            o["aggregate_review_count"] = agg.get("aggregate_review_count")
-                    reviews_map[key].extend(rvs)
-                    qna_map[key].extend(qa)
-                except Exception as e:
-                    print(f"[WARN] Lenovo reviews scrape failed for {key} {rurl}: {e}")
-
-        # Scrape HP reviews from dedicated review pages
-        for key in ["hp_probook_440", "hp_probook_450"]:
-            for rurl in TARGETS[key]["reviews"]:
+                    offer = await results.get_or_scrape(profile["scrape_pdp"], page, target["pdp"], run_ts)
+                    # A reused result still carries the run that first scraped it.
+                    offer["fetched_at"] = run_ts
+                    offers[key].append(offer)
+                except Exception:
+                    logger.exception("PDP scrape failed for %s", key)
+
+            # A URL listed twice would write its reviews twice
+            for rurl in dict.fromkeys(target["reviews"]):
                 try:
-                    rvs, qa, agg = await scrape_hp_reviews_page(page, rurl)
-                    if agg and offers[key]:
-                        o = offers[key][0]
-                        if agg.get("aggregate_rating") and not o.get("aggregate_rating"):
-                            o["aggregate_rating"] = agg.get("aggregate_rating")
-                        if agg.get("aggregate_review_count") and not o.get("aggregate_review_count"):
-                            o["aggregate_review_count"] = agg.get("aggregate_review_count")
-                    reviews_map[key].extend(rvs)
-                    qna_map[key].extend(qa)
-                except Exception as e:
-                    print(f"[WARN] HP reviews page failed for {key} {rurl}: {e}")
+                    if rurl in prefetched:
+                        rvs, qa, agg = prefetched[rurl]
+                    else:
+                        page = page or await pages.acquire()
+                        rvs, qa, agg = await scrape_reviews_recording(page, rurl, profile, results, endpoints)
+                    merge_review_aggregate(offers[key], agg)
+                    reviews_out.write(key, rvs)
+                    qna_out.write(key, qa)
+                except Exception:
+                    logger.exception("Reviews scrape failed for %s %s", key, rurl)
+        finally:
+            if page:
+                pages.release(page)
+
+
+async def scrape_host(
+    browser,
+    sem: asyncio.Semaphore,
+    host: str,
+    targets: Dict[str, Dict[str, Any]],
+    run_ts: str,
+    results: ResultCache,
+    offers: Dict[str, List[Dict[str, Any]]],
+    reviews_out: JsonlWriter,
+    qna_out: JsonlWriter,
+    prefetched: Dict[str, ReviewsPage],
+    endpoints: bazaarvoice.EndpointStore,
+) -> None:
+    """Scrape every target of one origin concurrently within a single context.
 
+    Sharing the context keeps cookies (consent banners, bot checks) and the
+    HTTP/2 connection warm across that origin's PDP and review pages. Targets
+    scraped at the same time get separate pages so navigations overlap; a
+    finished target's page is reused by the next one.
+    """
+    if host not in HOST_SCRAPERS:
+        logger.warning("No scraper registered for %s, skipping %s", host, list(targets))
+        return
+    profile = HOST_SCRAPERS[host]
+
+    # Reuse cookies/local storage from the previous run so consent banners and
+    # bot checks that were already passed are not paid for again
+    state_path = STORAGE_STATE_DIR / f"{host}.json"
+    options = dict(CONTEXT_OPTIONS)
+    if state_path.exists():
+        options["storage_state"] = str(state_path)
+
+    context = await browser.new_context(**options)
+    await context.route("**/*", block_heavy_resources)
+    pages = PagePool(context)
+    try:
+        outcomes = await asyncio.gather(*(
+            scrape_target(
+                pages, sem, profile, key, target, run_ts, results, offers, reviews_out, qna_out, prefetched, endpoints
+            )
+            for key, target in targets.items()
+        ), return_exceptions=True)
+        for key, result in zip(targets, outcomes):
+            if isinstance(result, Exception):
+                logger.error("Scrape task failed for %s: %s", key, result)
+        try:
+            state_path.parent.mkdir(parents=True, exist_ok=True)
+            await context.storage_state(path=str(state_path))
+        except Exception as e:
+            logger.warning("Could not save storage state for %s: %s", host, e)
+    finally:
         await context.close()
-        await browser.close()
 
-    # Always write offers (working scraper)
-    OUT_OFFERS.write_text(json.dumps(offers, indent=2), encoding="utf-8")
-    print(f"✅ Wrote {OUT_OFFERS}")
-    
-    # Only write reviews/QnA if we actually got data (preserve existing dummy data)
-    total_reviews = sum(len(reviews) for reviews in reviews_map.values())
-    total_qna = sum(len(qna) for qna in qna_map.values())
-    
-    if total_reviews > 0:
-        OUT_REVIEWS.write_text(json.dumps(reviews_map, indent=2), encoding="utf-8")
-        print(f"✅ Wrote {OUT_REVIEWS} with {total_reviews} reviews")
+
+class Scraper:
+    """One warm Chromium plus the HTTP client and cache, reused across runs.
+
+    Use as ``async with Scraper() as scraper: await scraper.run_once()``. Each
+    run opens and closes its own per-origin contexts; the browser itself is
+    only launched on enter and closed on exit, so a long-running service pays
+    the startup cost once.
+    """
+
+    def __init__(self):
+        self._play = None
+        self._browser: Optional[asyncio.Task] = None
+        self.cache: Optional[ConditionalCache] = None
+        self.client: Optional[httpx.AsyncClient] = None
+        self.endpoints: Optional[bazaarvoice.EndpointStore] = None
+        self.results = ResultCache()
+
+    async def __aenter__(self) -> "Scraper":
+        self.cache = ConditionalCache(LIVE_CACHE)
+        self.endpoints = bazaarvoice.EndpointStore(BV_ENDPOINTS)
+        self.client = httpx.AsyncClient(
+            headers={"User-Agent": CONTEXT_OPTIONS["user_agent"], **CONTEXT_OPTIONS["extra_http_headers"]},
+            follow_redirects=True,
+            timeout=10,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+        try:
+            self._play = await async_playwright().start()
+        except BaseException:
+            await self.client.aclose()
+            self.cache.close()
+            raise
+        # Launched in the background so the first run's HTTP fast path overlaps it
+        self._browser = asyncio.ensure_future(get_browser(self._play))
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        try:
+            if self._browser and not self._browser.done():
+                # A launch nobody waited for is not worth finishing just to close it
+                self._browser.cancel()
+                await asyncio.gather(self._browser, return_exceptions=True)
+            elif self._browser and not self._browser.cancelled() and not self._browser.exception():
+                await self._browser.result().close()
+            if self._play:
+                await self._play.stop()
+        finally:
+            await self.client.aclose()
+            self.cache.close()
+            self.endpoints.save()
+
+    async def run_once(
+        self,
+        reviews_out: JsonlWriter,
+        qna_out: JsonlWriter,
+        targets: Dict[str, Dict[str, Any]] = TARGETS,
+        concurrency: int = MAX_CONCURRENT_PAGES,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Scrape every target once, streaming reviews/Q&A out and returning offers by target."""
+        offers: Dict[str, List[Dict[str, Any]]] = {k: [] for k in targets}
+        # One timestamp for every offer captured in this run
+        run_ts = now_iso()
+
+        # Plain-HTTP PDP and Bazaarvoice fetches run first (overlapping browser
+        # startup on the first run); the browser then only handles the pages
+        # they could not resolve
+        if self._browser is None:
+            self._browser = asyncio.ensure_future(get_browser(self._play))
+        fast = asyncio.gather(
+            scrape_pdps_fast(self.client, self.cache, targets, run_ts, offers),
+            scrape_reviews_pages_fast(self.client, self.endpoints, targets),
+        )
+        try:
+            browser = await self._browser
+        except Exception:
+            logger.exception("Browser unavailable; keeping fast-path results only")
+            browser = None
+        _, prefetched = await fast
+        if browser is None:
+            # The next run launches it again
+            self._browser = None
+            write_prefetched_reviews(targets, prefetched, offers, reviews_out, qna_out)
+            return offers
+        # Caps open pages across all origins to bound Chromium memory
+        sem = asyncio.Semaphore(concurrency)
+        # Different origins run in parallel; each origin reuses one context
+        await asyncio.gather(*(
+            scrape_host(
+                browser, sem, host, host_targets, run_ts, self.results, offers, reviews_out, qna_out,
+                prefetched, self.endpoints,
+            )
+            for host, host_targets in group_targets_by_host(targets).items()
+        ))
+        return offers
+
+
+async def scrape_all(
+    targets: Dict[str, Dict[str, Any]],
+    reviews_out: JsonlWriter,
+    qna_out: JsonlWriter,
+    concurrency: int = MAX_CONCURRENT_PAGES,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """One-off scrape of targets on a single browser with at most concurrency pages open."""
+    async with Scraper() as scraper:
+        return await scraper.run_once(reviews_out, qna_out, targets, concurrency)
+
+
+def write_json(path: Path, obj: Any) -> None:
+    path.write_bytes(json_codec.dumps(obj, indent=PRETTY_JSON))
+
+
+async def main():
+    # SCRAPER_LOG_LEVEL=DEBUG turns on the per-page diagnostics
+    log_level = os.getenv("SCRAPER_LOG_LEVEL")
+    if log_level:
+        if isinstance(logging.getLevelName(log_level.upper()), int):
+            logger.setLevel(log_level.upper())
+        else:
+            logger.warning("Unknown SCRAPER_LOG_LEVEL %r, using INFO", log_level)
+            logger.setLevel(logging.INFO)
+
+    # Reviews/QnA stream to disk as pages finish; an empty run leaves the
+    # existing files (e.g. dummy data) untouched
+    with JsonlWriter(OUT_REVIEWS) as reviews_out, JsonlWriter(OUT_QNA) as qna_out:
+        async with Scraper() as scraper:
+            offers = await scraper.run_once(reviews_out, qna_out)
+            # Always write offers (working scraper); encoding and disk I/O run
+            # on a thread while the browser shuts down
+            write_offers = asyncio.get_running_loop().run_in_executor(None, write_json, OUT_OFFERS, offers)
+        await write_offers
+    logger.info("Wrote %s", OUT_OFFERS)
+
+    if reviews_out.count:
+        logger.info("Wrote %s with %s reviews", OUT_REVIEWS, reviews_out.count)
     else:
-        print(f"⚠️ No reviews scraped, preserving existing {OUT_REVIEWS}")
-    
-    if total_qna > 0:
-        OUT_QNA.write_text(json.dumps(qna_map, indent=2), encoding="utf-8")
-        print(f"✅ Wrote {OUT_QNA} with {total_qna} Q&A items")
+        logger.warning("No reviews scraped, preserving existing %s", OUT_REVIEWS)
+
+    if qna_out.count:
+        logger.info("Wrote %s with %s Q&A items", OUT_QNA, qna_out.count)
     else:
-        print(f"⚠️ No Q&A scraped, preserving existing {OUT_QNA}")
+        logger.warning("No Q&A scraped, preserving existing %s", OUT_QNA)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
     asyncio.run(main())
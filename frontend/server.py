@@ -2,13 +2,24 @@
 """
 Simple HTTP server for the frontend on port 3000.
 This serves the static files independently from the backend.
+
+Files are served by uvicorn with FastAPI's StaticFiles (both already backend
+requirements); the stdlib http.server is only used if they are missing.
 """
 
 import http.server
-import socketserver
 import os
+import socket
 from pathlib import Path
 
+try:
+    import uvicorn
+    from fastapi import FastAPI
+    from fastapi.middleware.cors import CORSMiddleware
+    from fastapi.staticfiles import StaticFiles
+except ImportError:
+    uvicorn = None
+
 # Change to the static directory
 static_dir = Path(__file__).parent / "static"
 os.chdir(static_dir)
@@ -28,6 +39,24 @@ class MyHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
         self.send_response(200)
         self.end_headers()
 
+class ThreadedServer(http.server.ThreadingHTTPServer):
+    # Rebind right after a restart; don't wait on open connections at Ctrl+C
+    allow_reuse_address = True
+    daemon_threads = True
+
+def create_app():
+    """FastAPI app serving the static directory, with index.html at /."""
+    app = FastAPI()
+    # Allow API calls to localhost:8000
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_methods=["GET", "POST", "OPTIONS"],
+        allow_headers=["Content-Type"],
+    )
+    app.mount("/", StaticFiles(directory=str(static_dir), html=True), name="static")
+    return app
+
 def run_server():
     """Start the frontend server on port 3000."""
     
@@ -40,7 +69,17 @@ def run_server():
     print("Press Ctrl+C to stop the server\n")
     
     try:
-        with socketserver.TCPServer(("", PORT), MyHTTPRequestHandler) as httpd:
+        if uvicorn is not None:
+            # Bound here rather than by uvicorn so a busy port gets the message below
+            sock = socket.create_server(("0.0.0.0", PORT))
+            print(f"✅ Frontend server running at http://localhost:{PORT}")
+            print("📱 Open this URL in your browser")
+            uvicorn.Server(uvicorn.Config(create_app(), log_level="warning")).run(sockets=[sock])
+            print("\n👋 Frontend server stopped")
+            return
+
+        # Thread per request so parallel asset loads don't queue behind each other
+        with ThreadedServer(("", PORT), MyHTTPRequestHandler) as httpd:
             print(f"✅ Frontend server running at http://localhost:{PORT}")
             print("📱 Open this URL in your browser")
             httpd.serve_forever()
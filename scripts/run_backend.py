@@ -5,6 +5,7 @@ This script handles the complete setup and launch process.
 """
 
 import asyncio
+import logging
 import os
 import sys
 import subprocess
@@ -28,16 +29,37 @@ def check_requirements():
         print("Please run: pip install -r requirements.txt")
         return False
 
+# Written after a successful Playwright check so later startups skip the subprocess
+PLAYWRIGHT_MARKER = Path.home() / ".cache" / "laptop_intel" / "playwright_ok"
+
 def check_playwright():
     """Check if Playwright browsers are installed."""
+    try:
+        from importlib.metadata import version
+        playwright_version = version("playwright")
+    except Exception:
+        playwright_version = "unknown"
+    # The marker records the version it was written for, so an upgrade rechecks
+    try:
+        if PLAYWRIGHT_MARKER.read_text() == playwright_version:
+            print("✅ Playwright is available")
+            return True
+    except OSError:
+        pass
+
     try:
         result = subprocess.run(
-            ["playwright", "install", "--help"], 
-            capture_output=True, 
-            text=True
+            ["playwright", "install", "--help"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
         if result.returncode == 0:
             print("✅ Playwright is available")
+            try:
+                PLAYWRIGHT_MARKER.parent.mkdir(parents=True, exist_ok=True)
+                PLAYWRIGHT_MARKER.write_text(playwright_version)
+            except OSError:
+                pass
             return True
     except FileNotFoundError:
         pass
@@ -106,6 +128,7 @@ def start_server():
 
 async def main():
     """Main startup function."""
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
     print("🎯 Laptop Intelligence Engine - Startup Script")
     print("=" * 50)
     